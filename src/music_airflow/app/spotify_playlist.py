@@ -40,6 +40,12 @@ SPOTIFY_SCOPES = [
 TOKEN_URI = "https://accounts.spotify.com/api/token"
 AUTH_URI = "https://accounts.spotify.com/authorize"
 
+# Track ID patterns, compiled once since they run for every playlist track
+_TRACK_ID_PATTERNS = (
+    re.compile(r"spotify\.com/track/([a-zA-Z0-9]{22})"),
+    re.compile(r"spotify:track:([a-zA-Z0-9]{22})"),
+)
+
 
 @dataclass
 class SpotifyOAuthCredentials:
@@ -519,12 +525,8 @@ class SpotifyPlaylistGenerator:
         # Handle URLs like:
         # https://open.spotify.com/track/4uLU6hMCjMI75M1A2tKUQC
         # spotify:track:4uLU6hMCjMI75M1A2tKUQC
-        patterns = [
-            r"spotify\.com/track/([a-zA-Z0-9]{22})",
-            r"spotify:track:([a-zA-Z0-9]{22})",
-        ]
-        for pattern in patterns:
-            match = re.search(pattern, url)
+        for pattern in _TRACK_ID_PATTERNS:
+            match = pattern.search(url)
             if match:
                 return match.group(1)
         return None
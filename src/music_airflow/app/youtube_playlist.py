@@ -46,6 +46,12 @@ logger = logging.getLogger(__name__)
 YOUTUBE_SCOPES = ["https://www.googleapis.com/auth/youtube.force-ssl"]
 TOKEN_URI = "https://oauth2.googleapis.com/token"
 
+# Video ID patterns, compiled once since they run for every playlist track
+_VIDEO_ID_PATTERNS = (
+    re.compile(r"(?:v=|/)([0-9A-Za-z_-]{11})"),
+    re.compile(r"youtu\.be/([0-9A-Za-z_-]{11})"),
+)
+
 
 @dataclass
 class OAuthCredentials:
@@ -650,12 +656,8 @@ class YouTubePlaylistGenerator:
     @staticmethod
     def _extract_video_id(url: str) -> Optional[str]:
         """Extract video ID from YouTube URL."""
-        patterns = [
-            r"(?:v=|/)([0-9A-Za-z_-]{11})",
-            r"youtu\.be/([0-9A-Za-z_-]{11})",
-        ]
-        for pattern in patterns:
-            match = re.search(pattern, url)
+        for pattern in _VIDEO_ID_PATTERNS:
+            match = pattern.search(url)
             if match:
                 return match.group(1)
         return None
@@ -26,8 +26,6 @@ from airflow.sdk import Asset, dag, task
 from airflow.sdk.definitions.param import Param
 
 from music_airflow.utils.constants import DAG_START_DATE, LAST_FM_USERNAMES
-from music_airflow.extract import extract_plays_to_bronze
-from music_airflow.transform import transform_plays_to_silver
 
 # Define the plays asset - same as extract_plays.py
 plays_asset = Asset("delta://data/silver/plays")
@@ -115,6 +113,8 @@ def backfill_user():
         import asyncio
         import logging
         from airflow.sdk import get_current_context
+        from music_airflow.extract import extract_plays_to_bronze
+        from music_airflow.transform import transform_plays_to_silver
 
         logger = logging.getLogger(__name__)
         context = get_current_context()
@@ -21,8 +21,6 @@ from typing import Any
 from airflow.sdk import Asset, dag, task
 
 from music_airflow.utils.constants import LAST_FM_USERNAMES, DAG_START_DATE
-from music_airflow.extract import extract_plays_to_bronze
-from music_airflow.transform import transform_plays_to_silver
 
 # Define the plays asset - used for scheduling downstream DAGs
 plays_asset = Asset("delta://data/silver/plays")
@@ -67,6 +65,7 @@ def lastfm_plays():
         """
         import asyncio
         from airflow.sdk import get_current_context
+        from music_airflow.extract import extract_plays_to_bronze
 
         # Get data_interval_start from Airflow context
         context = get_current_context()
@@ -97,6 +96,8 @@ def lastfm_plays():
         Returns:
             Metadata dict with path, filename, rows, schema, format, medallion_layer, username, from/to datetimes
         """
+        from music_airflow.transform import transform_plays_to_silver
+
         return transform_plays_to_silver(fetch_metadata)
 
     # Define task dependencies - process each user independently
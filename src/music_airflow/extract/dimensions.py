@@ -17,10 +17,10 @@ from music_airflow.lastfm_client import LastFMClient
 from music_airflow.utils.polars_io_manager import PolarsDeltaIOManager, JSONIOManager
 from music_airflow.utils.lastfm_scraper import LastFMScraper
 from music_airflow.utils.text_normalization import (
-    normalize_text,
+    normalize_text_batch,
     generate_canonical_artist_id_expr,
 )
-from music_airflow.utils.ytmusic_search import search_youtube_url
+from music_airflow.utils.ytmusic_search import search_youtube_urls
 from music_airflow.utils.spotify_search import search_spotify_url, is_spotify_configured
 import polars as pl
 import logging
@@ -165,13 +165,20 @@ async def extract_tracks_to_bronze() -> dict[str, Any]:
         # We search using NORMALIZED names to find the canonical version (most listeners)
         logger.info(f"Finding popular versions for {len(tracks_data)} tracks...")
 
+        # Normalize all names once, the same way stored track IDs are built;
+        # reused by every search below
+        normalized_track_names = normalize_text_batch(
+            [track.get("name", "") for track in tracks_data]
+        )
+        normalized_artist_names = normalize_text_batch(
+            [track.get("artist", {}).get("name", "") for track in tracks_data]
+        )
+
         search_tasks = [
-            client.search_track(
-                track=normalize_text(track.get("name", "")),
-                artist=normalize_text(track.get("artist", {}).get("name", "")),
-                limit=1,
+            client.search_track(track=track_name, artist=artist_name, limit=1)
+            for track_name, artist_name in zip(
+                normalized_track_names, normalized_artist_names
             )
-            for track in tracks_data
         ]
         search_results = await asyncio.gather(*search_tasks, return_exceptions=True)
 
@@ -189,19 +196,21 @@ async def extract_tracks_to_bronze() -> dict[str, Any]:
     # Primary: Use YTMusic search for YouTube URLs (faster than scraping, better audio results)
     # YTMusic filters for audio-only versions, avoiding music videos
     logger.info(f"Searching YTMusic for {len(tracks_data)} tracks...")
-    ytmusic_found = 0
+    searchable = [
+        idx
+        for idx in range(len(tracks_data))
+        if normalized_track_names[idx] and normalized_artist_names[idx]
+    ]
+    youtube_urls = await search_youtube_urls(
+        [
+            (normalized_track_names[idx], normalized_artist_names[idx])
+            for idx in searchable
+        ]
+    )
+    youtube_url_by_idx = dict(zip(searchable, youtube_urls))
+    ytmusic_found = sum(1 for url in youtube_urls if url)
     for idx, track in enumerate(tracks_data):
-        track_name = normalize_text(track.get("name", ""))
-        artist_name = normalize_text(track.get("artist", {}).get("name", ""))
-        if track_name and artist_name:
-            youtube_url = search_youtube_url(track_name, artist_name)
-            if youtube_url:
-                track["youtube_url"] = youtube_url
-                ytmusic_found += 1
-            else:
-                track["youtube_url"] = None
-        else:
-            track["youtube_url"] = None
+        track["youtube_url"] = youtube_url_by_idx.get(idx)
         track["spotify_url"] = (
             None  # Will be populated from Spotify search or Last.fm fallback
         )
@@ -213,8 +222,8 @@ async def extract_tracks_to_bronze() -> dict[str, Any]:
     if spotify_configured:
         logger.info(f"Searching Spotify for {len(tracks_data)} tracks...")
         for idx, track in enumerate(tracks_data):
-            track_name = normalize_text(track.get("name", ""))
-            artist_name = normalize_text(track.get("artist", {}).get("name", ""))
+            track_name = normalized_track_names[idx]
+            artist_name = normalized_artist_names[idx]
             if track_name and artist_name:
                 spotify_url = search_spotify_url(track_name, artist_name)
                 if spotify_url:
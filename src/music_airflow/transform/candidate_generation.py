@@ -22,7 +22,6 @@ from music_airflow.lastfm_client import LastFMClient
 from music_airflow.utils.polars_io_manager import PolarsDeltaIOManager
 from music_airflow.utils.firestore_io_manager import FirestoreIOManager
 from music_airflow.utils.text_normalization import (
-    generate_canonical_track_id,
     generate_canonical_track_id_expr,
 )
 
@@ -403,7 +402,6 @@ async def generate_similar_artist_candidates(
         # Process all results
         total_tracks_examined = 0
         tracks_filtered_by_min_listeners = 0
-        tracks_filtered_by_already_played = 0
         top_tracks_failures = 0
 
         for top_tracks, metadata in zip(all_top_tracks, task_metadata):
@@ -434,14 +432,6 @@ async def generate_similar_artist_candidates(
                     tracks_filtered_by_min_listeners += 1
                     continue
 
-                # Create canonical track ID using text normalization
-                track_id = generate_canonical_track_id(track_name, artist_name_track)
-
-                # Skip if already played
-                if track_id in played_track_ids_set:
-                    tracks_filtered_by_already_played += 1
-                    continue
-
                 # Score = similarity * user's play count of source artist * track global playcount
                 # This prioritizes: tracks from similar artists to heavily played artists
                 score = (
@@ -461,17 +451,24 @@ async def generate_similar_artist_candidates(
                     }
                 )
 
-        logger.info(
-            f"Similar-artist generation for {username}: "
-            f"examined {total_tracks_examined} tracks from {len(top_track_tasks)} similar artists, "
-            f"filtered {tracks_filtered_by_min_listeners} by min_listeners ({min_listeners}), "
-            f"filtered {tracks_filtered_by_already_played} already played, "
-            f"{top_tracks_failures} top tracks failures, "
-            f"result: {len(all_candidates)} candidates"
-        )
+    # Resolve canonical track IDs for all candidates in one vectorized pass and
+    # drop tracks the user has already played
+    df = _resolve_track_ids(all_candidates, delta_mgr_silver)
+    if all_candidates:
+        df = df.join(played_track_ids_df, on="track_id", how="anti")
+    tracks_filtered_by_already_played = len(all_candidates) - len(df)
+
+    logger.info(
+        f"Similar-artist generation for {username}: "
+        f"examined {total_tracks_examined} tracks from {len(top_track_tasks)} similar artists, "
+        f"filtered {tracks_filtered_by_min_listeners} by min_listeners ({min_listeners}), "
+        f"filtered {tracks_filtered_by_already_played} already played, "
+        f"{top_tracks_failures} top tracks failures, "
+        f"result: {len(df)} candidates"
+    )
 
     # Convert to DataFrame and deduplicate
-    if not all_candidates:
+    if df.is_empty():
         # Create empty DataFrame with correct schema
         df = pl.DataFrame(
             schema={
@@ -483,8 +480,6 @@ async def generate_similar_artist_candidates(
             }
         )
     else:
-        # Resolve track IDs from dimension table
-        df = _resolve_track_ids(all_candidates, delta_mgr_silver)
         df = (
             df.unique(subset=["track_id"])  # dedup by track
             .sort("score", descending=True)
@@ -656,9 +651,9 @@ async def generate_similar_tag_candidates(
     played_track_ids = plays.select("track_id").unique().collect(engine="streaming")
     played_track_ids_set = set(played_track_ids["track_id"].to_list())
 
-    # Collect tracks with tag associations
-    # track_id -> {track_info, tags: [tag1, tag2, ...], ranks: [rank1, rank2, ...]}
-    track_tag_map: dict[str, dict[str, Any]] = {}
+    # Collect (track, tag) pairs; canonical IDs are generated for all of them
+    # at once with the native Polars expressions once every tag is fetched
+    tagged_tracks: list[dict[str, Any]] = []
 
     async with LastFMClient() as client:
         # Fetch all tag top tracks concurrently
@@ -674,7 +669,6 @@ async def generate_similar_tag_candidates(
 
         # Process all results
         total_tracks_examined = 0
-        tracks_filtered_by_already_played = 0
         tag_fetch_failures = 0
 
         for tag, top_tracks in zip(top_tags, all_tag_tracks):
@@ -696,39 +690,49 @@ async def generate_similar_tag_candidates(
                 else:
                     artist_name = str(artist_info) if artist_info else ""
 
-                # Generate canonical track ID
-                track_id = generate_canonical_track_id(track_name, artist_name)
-
-                # Skip if already played
-                if track_id in played_track_ids_set:
-                    tracks_filtered_by_already_played += 1
-                    continue
-
-                # Add or update track in map
-                if track_id not in track_tag_map:
-                    track_tag_map[track_id] = {
-                        "username": username,
+                tagged_tracks.append(
+                    {
                         "track_name": track_name,
                         "artist_name": artist_name,
-                        "tags": [],
+                        "tag": tag,
                     }
+                )
 
-                track_tag_map[track_id]["tags"].append(tag)
-
-        logger.info(
-            f"Tag generation for {username}: "
-            f"examined {total_tracks_examined} tracks from {len(top_tags)} tags, "
-            f"filtered {tracks_filtered_by_already_played} already played, "
-            f"{tag_fetch_failures} tag fetch failures, "
-            f"result: {len(track_tag_map)} unique tracks before min_tag_matches filter"
+    # Generate canonical track IDs, skip already played tracks, and group
+    # the tags each track appeared under (first seen name wins)
+    track_tags = pl.DataFrame(
+        schema={
+            "track_id": pl.String,
+            "track_name": pl.String,
+            "artist_name": pl.String,
+            "tag": pl.List(pl.String),
+        }
+    )
+    tracks_filtered_by_already_played = 0
+    if tagged_tracks:
+        tagged_df = _resolve_track_ids(tagged_tracks, delta_mgr_silver)
+        unplayed_df = tagged_df.join(played_track_ids, on="track_id", how="anti")
+        tracks_filtered_by_already_played = len(tagged_df) - len(unplayed_df)
+        track_tags = unplayed_df.group_by("track_id", maintain_order=True).agg(
+            pl.col("track_name").first(),
+            pl.col("artist_name").first(),
+            pl.col("tag"),
         )
 
+    logger.info(
+        f"Tag generation for {username}: "
+        f"examined {total_tracks_examined} tracks from {len(top_tags)} tags, "
+        f"filtered {tracks_filtered_by_already_played} already played, "
+        f"{tag_fetch_failures} tag fetch failures, "
+        f"result: {len(track_tags)} unique tracks before min_tag_matches filter"
+    )
+
     # Filter tracks by minimum tag matches and calculate scores
     all_candidates = []
     tracks_filtered_by_min_tag_matches = 0
 
-    for track_id, track_data in track_tag_map.items():
-        tag_match_count = len(track_data["tags"])
+    for track_data in track_tags.iter_rows(named=True):
+        tag_match_count = len(track_data["tag"])
 
         if tag_match_count < min_tag_matches:
             tracks_filtered_by_min_tag_matches += 1
@@ -739,12 +743,13 @@ async def generate_similar_tag_candidates(
 
         all_candidates.append(
             {
-                "username": track_data["username"],
+                "username": username,
+                "track_id": track_data["track_id"],
                 "track_name": track_data["track_name"],
                 "artist_name": track_data["artist_name"],
                 "tag_match_count": tag_match_count,
                 "score": score,
-                "source_tags": ",".join(track_data["tags"]),
+                "source_tags": ",".join(track_data["tag"]),
             }
         )
 
@@ -765,10 +770,9 @@ async def generate_similar_tag_candidates(
             }
         )
     else:
-        # Resolve track IDs from dimension table
-        df = _resolve_track_ids(all_candidates, delta_mgr_silver)
         df = (
-            df.with_columns(
+            pl.DataFrame(all_candidates)
+            .with_columns(
                 pl.col("username").cast(pl.String),
                 pl.col("track_id").cast(pl.String),
                 pl.col("tag_match_count").cast(pl.Int64),
@@ -1031,7 +1035,6 @@ async def generate_deep_cut_candidates(
         # Process all results
         total_tracks_examined = 0
         tracks_filtered_by_album_listeners = 0
-        tracks_filtered_by_already_played = 0
         album_info_failures = 0
 
         for album_info, metadata in zip(all_album_info, album_metadata):
@@ -1060,15 +1063,6 @@ async def generate_deep_cut_candidates(
                     tracks_filtered_by_album_listeners += 1
                     continue
 
-                # Generate canonical track ID
-                track_id = generate_canonical_track_id(
-                    track_name, metadata["artist_name"]
-                )
-
-                if track_id in played_track_ids_set:
-                    tracks_filtered_by_already_played += 1
-                    continue
-
                 # Score = user's artist play count * album global popularity
                 # This prioritizes deep cuts from artists the user actually likes
                 score = float(metadata["user_artist_play_count"] * album_listeners)
@@ -1083,17 +1077,24 @@ async def generate_deep_cut_candidates(
                     }
                 )
 
-        logger.info(
-            f"Deep-cut generation for {username}: "
-            f"examined {total_tracks_examined} tracks from {len(album_info_tasks)} albums, "
-            f"filtered {tracks_filtered_by_album_listeners} by min_listeners ({min_listeners}), "
-            f"filtered {tracks_filtered_by_already_played} already played, "
-            f"{album_info_failures} album info failures, "
-            f"result: {len(all_candidates)} candidates"
-        )
+    # Resolve canonical track IDs for all candidates in one vectorized pass and
+    # drop tracks the user has already played
+    df = _resolve_track_ids(all_candidates, delta_mgr_silver)
+    if all_candidates:
+        df = df.join(played_track_ids_df, on="track_id", how="anti")
+    tracks_filtered_by_already_played = len(all_candidates) - len(df)
+
+    logger.info(
+        f"Deep-cut generation for {username}: "
+        f"examined {total_tracks_examined} tracks from {len(album_info_tasks)} albums, "
+        f"filtered {tracks_filtered_by_album_listeners} by min_listeners ({min_listeners}), "
+        f"filtered {tracks_filtered_by_already_played} already played, "
+        f"{album_info_failures} album info failures, "
+        f"result: {len(df)} candidates"
+    )
 
     # Convert to DataFrame and deduplicate
-    if not all_candidates:
+    if df.is_empty():
         # Create empty DataFrame with correct schema
         df = pl.DataFrame(
             schema={
@@ -1104,8 +1105,6 @@ async def generate_deep_cut_candidates(
             }
         )
     else:
-        # Resolve track IDs from dimension table
-        df = _resolve_track_ids(all_candidates, delta_mgr_silver)
         df = (
             df.with_columns(
                 pl.col("username").cast(pl.String),
@@ -1379,7 +1378,9 @@ def merge_candidate_sources(
             # Fallback: title-case the artist_id if dimension lookup fails
             pl.coalesce(
                 pl.col("source_artist_name"),
-                pl.col("source_artist_id").str.replace_all("_", " ").str.to_titlecase(),
+                pl.col("source_artist_id")
+                .str.replace_all("_", " ", literal=True)
+                .str.to_titlecase(),
             ).alias("source_artist_name")
         )
 
@@ -1448,7 +1449,9 @@ def merge_candidate_sources(
         ).with_columns(
             pl.coalesce(
                 pl.col("deep_cut_artist_name"),
-                pl.col("source_artist_id").str.replace_all("_", " ").str.to_titlecase(),
+                pl.col("source_artist_id")
+                .str.replace_all("_", " ", literal=True)
+                .str.to_titlecase(),
             ).alias("deep_cut_artist_name")
         )
 
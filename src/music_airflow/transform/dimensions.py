@@ -14,9 +14,9 @@ from deltalake.exceptions import TableNotFoundError
 
 from music_airflow.utils.polars_io_manager import JSONIOManager, PolarsDeltaIOManager
 from music_airflow.utils.text_normalization import (
-    generate_canonical_track_id_expr,
     generate_canonical_artist_id_expr,
     is_music_video_expr,
+    normalize_text_expr,
 )
 
 logger = logging.getLogger(__name__)
@@ -319,9 +319,15 @@ def _deduplicate_tracks(tracks_lf: pl.LazyFrame) -> pl.LazyFrame:
     has_spotify = "spotify_url" in schema_names
 
     # Add helper columns for deduplication using native Polars expressions
+    # Normalize the artist once: it is the artist_id and the second half of the
+    # canonical track_id ("normalized_track|normalized_artist")
     tracks_with_helpers = tracks_lf.with_columns(
+        generate_canonical_artist_id_expr("artist_name").alias("artist_id"),
+    ).with_columns(
         # Generate canonical track_id from normalized names
-        generate_canonical_track_id_expr("track_name", "artist_name").alias("track_id"),
+        pl.concat_str(
+            [normalize_text_expr("track_name"), pl.lit("|"), pl.col("artist_id")]
+        ).alias("track_id"),
         # Detect music videos
         is_music_video_expr("track_name").alias("is_music_video"),
         # Fill null playcount for sorting
@@ -356,15 +362,11 @@ def _deduplicate_tracks(tracks_lf: pl.LazyFrame) -> pl.LazyFrame:
     if has_spotify:
         agg_list.append(pl.first("spotify_url").cast(pl.String).alias("spotify_url"))
 
-    # Group by canonical track_id
-    deduplicated = sorted_tracks.group_by("track_id").agg(agg_list)
-
-    # Generate artist_id using native Polars normalization
-    deduplicated = deduplicated.with_columns(
-        generate_canonical_artist_id_expr("artist_name").alias("artist_id")
-    )
+    # Every version in a group shares the normalized artist in its track_id
+    agg_list.append(pl.first("artist_id").alias("artist_id"))
 
-    return deduplicated
+    # Group by canonical track_id
+    return sorted_tracks.group_by("track_id").agg(agg_list)
 
 
 def _deduplicate_artists(artists_lf: pl.LazyFrame) -> pl.LazyFrame:
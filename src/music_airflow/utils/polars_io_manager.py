@@ -210,32 +210,24 @@ class PolarsParquetIOManager:
         path = self.base_dir / filename
         path.parent.mkdir(parents=True, exist_ok=True)
 
-        def collect_metadata(df: pl.LazyFrame | pl.DataFrame) -> tuple[int, dict]:
-            """Helper to collect row count and schema from LazyFrame."""
-            if isinstance(df, pl.DataFrame):
-                return df.select(pl.len()).item(), df.schema
-            try:
-                rows = df.select(pl.len()).collect(engine="streaming").item()
-            except Exception:
-                rows = df.select(pl.len()).collect().item()
-            schema = df.collect_schema()
-            return rows, schema
-
         # Collect LazyFrame if needed using streaming engine with fallback
         if isinstance(df, pl.LazyFrame):
             try:
                 df.sink_parquet(path, **kwargs)
-                rows, schema = collect_metadata(df)
+                # Count rows from the written file's metadata rather than
+                # re-running the query
+                rows = pl.scan_parquet(path).select(pl.len()).collect().item()
+                schema = df.collect_schema()
             except Exception:
                 try:
                     df = df.collect(engine="streaming")
                 except Exception:
                     df = df.collect()
                 df.write_parquet(path, **kwargs)
-                rows, schema = collect_metadata(df)
+                rows, schema = df.height, df.schema
         else:
             df.write_parquet(path, **kwargs)
-            rows, schema = collect_metadata(df)
+            rows, schema = df.height, df.schema
 
         return {
             "path": str(path.absolute()),
@@ -307,6 +299,9 @@ class PolarsDeltaIOManager:
             self.is_cloud = False
             self.storage_options = None
 
+        # Local table directories already created by this manager
+        self._mkdir_cache: set[str] = set()
+
     def _get_table_uri(self, table_name: str) -> str:
         """Get the full URI for a table."""
         if self.is_cloud:
@@ -346,9 +341,10 @@ class PolarsDeltaIOManager:
 
         table_uri = self._get_table_uri(table_name)
 
-        # For local storage, ensure directory exists
-        if not self.is_cloud:
+        # For local storage, ensure directory exists (once per table URI)
+        if not self.is_cloud and table_uri not in self._mkdir_cache:
             Path(table_uri).mkdir(parents=True, exist_ok=True)
+            self._mkdir_cache.add(table_uri)
 
         # Prepare delta_write_options
         delta_write_options = kwargs.pop("delta_write_options", {})
@@ -6,17 +6,19 @@ Includes retry logic with exponential backoff for rate limiting.
 """
 
 import logging
+import math
 import os
 from typing import Optional
 
 from dotenv import load_dotenv
+from requests.exceptions import Timeout
 from spotipy import Spotify
 from spotipy.exceptions import SpotifyException
 from spotipy.oauth2 import SpotifyClientCredentials
 from tenacity import (
     RetryCallState,
     retry,
-    retry_if_exception_type,
+    retry_if_exception,
     stop_after_attempt,
     wait_exponential,
 )
@@ -26,6 +28,12 @@ logger = logging.getLogger(__name__)
 # Global Spotify instance (lazy initialized)
 _spotify: Optional[Spotify] = None
 
+# HTTP statuses worth retrying (rate limit and transient server errors)
+_RETRIABLE_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+# Upper bound on a Retry-After wait, so one header cannot stall a task
+_MAX_RETRY_AFTER_SECONDS = 60.0
+
 
 def _get_spotify_credentials() -> tuple[Optional[str], Optional[str]]:
     """Get Spotify credentials from environment."""
@@ -67,18 +75,71 @@ def _log_retry_with_query(retry_state: RetryCallState) -> None:
     )
 
 
+def _is_retriable(exc: BaseException) -> bool:
+    """Retry only rate limits, 5xx errors and timeouts; fail fast on other 4xx."""
+    if isinstance(exc, SpotifyException):
+        return exc.http_status in _RETRIABLE_STATUSES
+    return isinstance(exc, Timeout)
+
+
+_wait_backoff = wait_exponential(multiplier=1, min=2, max=10)
+
+
+def _wait_retry_after(retry_state: RetryCallState) -> float:
+    """
+    Honor the Retry-After header on 429s, capped at _MAX_RETRY_AFTER_SECONDS.
+
+    Falls back to exponential backoff for other errors and for missing,
+    invalid, negative or non-finite Retry-After values.
+    """
+    exc = retry_state.outcome.exception() if retry_state.outcome else None
+    if isinstance(exc, SpotifyException) and exc.http_status == 429:
+        retry_after = (exc.headers or {}).get("Retry-After")
+        try:
+            seconds = float(retry_after)
+        except (TypeError, ValueError):
+            seconds = math.nan
+        if math.isfinite(seconds) and seconds >= 0:
+            return min(seconds, _MAX_RETRY_AFTER_SECONDS)
+    return _wait_backoff(retry_state)
+
+
 @retry(
-    retry=retry_if_exception_type(SpotifyException),
+    retry=retry_if_exception(_is_retriable),
     stop=stop_after_attempt(3),
-    wait=wait_exponential(multiplier=1, min=2, max=10),
+    wait=_wait_retry_after,
     before_sleep=_log_retry_with_query,
     reraise=True,
 )
 def _search_with_retry(spotify: Spotify, query: str, **kwargs) -> dict:
-    """Execute Spotify search with retry on SpotifyException."""
+    """Execute Spotify search with retry on rate limits and transient errors."""
     return spotify.search(query, **kwargs)
 
 
+def _pick_best_track(tracks: list[dict], artist_name: str) -> dict | None:
+    """
+    Pick the best track from search results, preferring an artist name match.
+
+    Args:
+        tracks: Track items from a Spotify search response
+        artist_name: Artist name to match against
+
+    Returns:
+        First track whose artists include artist_name (case-insensitive),
+        else the first track with an ID, or None if there are no results
+    """
+    tracks = [t for t in tracks if t and t.get("id")]
+    if not tracks:
+        return None
+
+    target = artist_name.casefold().strip()
+    for track in tracks:
+        artists = track.get("artists", [])
+        if any(a.get("name", "").casefold().strip() == target for a in artists):
+            return track
+    return tracks[0]
+
+
 def search_spotify_url(track_name: str, artist_name: str) -> Optional[str]:
     """
     Search for a track on Spotify and return the track URL.
@@ -114,26 +175,26 @@ def search_spotify_track_id(track_name: str, artist_name: str) -> Optional[str]:
     query = f"track:{track_name} artist:{artist_name}"
 
     try:
-        results = _search_with_retry(spotify, query, type="track", limit=5)
+        # A 10-result fielded query costs the same as a 5-result one and
+        # usually makes the bare-query fallback unnecessary
+        results = _search_with_retry(spotify, query, type="track", limit=10)
         tracks = results.get("tracks", {}).get("items", [])
 
-        if tracks:
-            # Return first track result
-            track = tracks[0]
-            track_id = track.get("id")
-            if track_id:
-                logger.debug(
-                    f"Spotify found track: {track.get('name')} by {', '.join(a['name'] for a in track.get('artists', []))}"
-                )
-                return track_id
-
-        # Fallback: simpler search without field specifiers
+        track = _pick_best_track(tracks, artist_name)
+        if track:
+            logger.debug(
+                f"Spotify found track: {track.get('name')} by {', '.join(a['name'] for a in track.get('artists', []))}"
+            )
+            return track["id"]
+
+        # Rare fallback: simpler search without field specifiers
         fallback_query = f"{track_name} {artist_name}"
-        results = _search_with_retry(spotify, fallback_query, type="track", limit=5)
+        results = _search_with_retry(spotify, fallback_query, type="track", limit=10)
         tracks = results.get("tracks", {}).get("items", [])
 
-        if tracks:
-            return tracks[0].get("id")
+        track = _pick_best_track(tracks, artist_name)
+        if track:
+            return track["id"]
 
     except SpotifyException as e:
         logger.warning(f"Spotify search error for '{query}': {e}")
@@ -10,58 +10,81 @@ from typing import Pattern
 
 import polars as pl
 
-
-# Compiled regex patterns for performance
+__all__ = [
+    "TAG_AUDIO_FORMAT",
+    "TAG_DEMO_TAKE",
+    "TAG_EXPLICIT",
+    "TAG_FEAT",
+    "TAG_LIVE",
+    "TAG_MUSIC_VIDEO",
+    "TAG_REMASTER",
+    "TAG_VERSION",
+    "generate_canonical_artist_id",
+    "generate_canonical_artist_id_expr",
+    "generate_canonical_track_id",
+    "generate_canonical_track_id_expr",
+    "is_music_video",
+    "is_music_video_expr",
+    "normalize_text",
+    "normalize_text_batch",
+    "normalize_text_expr",
+    "normalize_text_tagged",
+]
+
+# Compiled regex patterns for performance. Whitespace runs that are always
+# followed by a non-space token use possessive quantifiers (Python 3.11+), so
+# the engine never backtracks into them when the rest of a pattern fails.
+# Patterns that start with whitespace only start matching at the beginning of
+# a whitespace run ((?<!\s)): a match starting later in the run would be the
+# same match, and retrying at every position made long runs quadratic.
+# normalize_text lowercases its input before matching, so only patterns that
+# run on raw text (music video detection) are compiled with IGNORECASE. (The
+# one lowercase letter this misses is "ſ", which case-insensitive matching
+# would treat as "s"; see the Polars patterns below.)
 
 # Parenthetical patterns - match content inside () or []
 _REMASTER_PATTERN: Pattern = re.compile(
-    r"\s*[\(\[]"
-    r"(remaster(ed)?|re-master(ed)?|"
-    r"\d{4}\s+remaster(ed)?|"
-    r"remaster(ed)?\s+\d{4})"
+    r"(?<!\s)\s*+[\(\[]"
+    r"(re-?master(ed)?|\d{4}\s+remaster(ed)?|remaster(ed)?\s+\d{4})"
     r"[\)\]]",
-    re.IGNORECASE,
 )
 
 _LIVE_PATTERN: Pattern = re.compile(
-    r"\s*[\(\[]"
-    r"(live|live\s+at|live\s+from|live\s+in|live\s+on|"
-    r"live\s+\d{4}|live\s+version|live\s+recording)"
+    r"(?<!\s)\s*+[\(\[]"
+    # "Live", "Live at ...", "Live 1995", "Live Version", etc. The longer
+    # forms only matter when their whitespace crosses a newline, which ".*?"
+    # does not.
+    r"(live|live\s+(at|from|in|on)|live\s+\d{4}|live\s+(version|recording))"
     r".*?[\)\]]",
-    re.IGNORECASE,
 )
 
 _VERSION_PATTERN: Pattern = re.compile(
-    r"\s*[\(\[]"
-    r"(.*?\s+version|.*?\s+mix|.*?\s+edit|.*?\s+remix|"
-    r".*?\s+take|single\s+version|album\s+version|radio\s+edit|"
-    r"extended\s+(version|mix|edit)?|remix)"
+    r"(?<!\s)\s*+[\(\[]"
+    # "Single Version", "Radio Edit", "Extended Mix", etc. share the first
+    # branch, which may run past a closing bracket ("(Live) (Album Version)").
+    # The lazy prefix only ends where a whitespace run starts, so the
+    # whitespace before the keyword is not rescanned from every offset.
+    r"(.*?(?<!\s)\s++(version|mix|edit|remix|take)|extended|remix)"
     r"[\)\]]",
-    re.IGNORECASE,
 )
 
 _EXPLICIT_PATTERN: Pattern = re.compile(
-    r"\s*[\(\[]"
+    r"(?<!\s)\s*+[\(\[]"
     r"(explicit|clean|censored)"
     r"[\)\]]",
-    re.IGNORECASE,
 )
 
 _AUDIO_FORMAT_PATTERN: Pattern = re.compile(
-    r"\s*[\(\[]"
-    r"(stereo|mono|stereo\s+mix|mono\s+mix|"
-    r"stereo\s+version|mono\s+version|"
-    r"original\s+stereo|original\s+mono|"
-    r"true\s+stereo|simulated\s+stereo)"
+    r"(?<!\s)\s*+[\(\[]"
+    r"((stereo|mono)(\s+(mix|version))?|"
+    r"original\s+(stereo|mono)|(true|simulated)\s+stereo)"
     r"[\)\]]",
-    re.IGNORECASE,
 )
 
 _FEAT_PATTERN: Pattern = re.compile(
-    r"\s*[\(\[]?"
+    r"(?<!\s)\s*+[\(\[]?"
     r"(feat\.?|ft\.?|featuring|with|vs\.?|versus)"
     r".*?[\)\]]?$",
-    re.IGNORECASE,
 )
 
 _MUSIC_VIDEO_PATTERN: Pattern = re.compile(
@@ -70,39 +93,48 @@ _MUSIC_VIDEO_PATTERN: Pattern = re.compile(
     re.IGNORECASE,
 )
 
-_YEAR_PATTERN: Pattern = re.compile(r"\s*[\(\[]?\d{4}[\)\]]?\s*")
+_YEAR_PATTERN: Pattern = re.compile(
+    # Leading whitespace is optional, so a match may also start right after a
+    # previous match that consumed the whitespace before it
+    r"(?:(?<!\s)\s++)?[\(\[]?\d{4}[\)\]]?\s*+"
+)
 
 _PUNCTUATION_PATTERN: Pattern = re.compile(r"[^\w\s-]")
 
+# ASCII characters _PUNCTUATION_PATTERN removes, for the str.translate fast path
+_ASCII_PUNCTUATION_TABLE = str.maketrans(
+    "", "", "".join(c for c in map(chr, range(128)) if _PUNCTUATION_PATTERN.match(c))
+)
+
+# Used by the Polars expressions; normalize_text collapses with str.split()
 _WHITESPACE_PATTERN: Pattern = re.compile(r"\s+")
 
 # Parenthetical patterns for demo/take/video/audio indicators
 # These are inside () or [] brackets
 _DEMO_TAKE_PATTERN: Pattern = re.compile(
-    r"\s*[\(\[]"
+    r"(?<!\s)\s*+[\(\[]"
     r"("
-    r"demo|early\s+demo|"
-    r"take\s+\d+|early\s+take|"
+    r"early\s+(demo|take)|demo|take\s+\d+|"
     r"instrumental|acoustic|"
-    # Video patterns - may have prefix like "Agent Elvis - "
-    r"(.*\s*-\s*)?(official\s+)?(music\s+)?video|"
-    r"(.*\s*-\s*)?(official\s+)?(hd|4k|animated\s+music|animated)?\s*video|"
-    r"(.*\s*-\s*)?(official\s+)?lyric\s+video|"
-    r"(.*\s*-\s*)?visuali[sz]er|"
-    r"(.*\s*-\s*)?official\s+audio|"
-    r"outtakes?|sessions?|"
-    r"alternate|"
-    r"dub"
+    # Video patterns - may have prefix like "Agent Elvis - ", up to the last
+    # dash that lets the rest match
+    r"(.*-\s*)?(official\s+)?(music\s+)?video|"
+    r"(.*-\s*)?(official\s+)?(hd|4k|animated(\s+music)?)?\s*video|"
+    r"(.*-\s*)?(official\s+)?lyric\s+video|"
+    r"(.*-\s*)?visuali[sz]er|"
+    r"(.*-\s*)?official\s+audio|"
+    r"(outtake|session)s?|alternate|dub"
     r")"
     r"[\)\]]",
-    re.IGNORECASE,
 )
 
 # Dash-separated suffix patterns (e.g., "Song - Early Take", "Song - Demo")
 # These appear after " - " and indicate alternate versions
-# Match everything after " - " that looks like a version indicator
+# Match everything after " - " that looks like a version indicator. The
+# optional tails are kept even though ".*$" removes the rest of the line
+# anyway: their \s can cross a newline that ".*" cannot.
 _DASH_SUFFIX_PATTERN: Pattern = re.compile(
-    r"\s+-\s+("
+    r"(?<!\s)\s++-\s++("
     # Year prefix patterns like "2004 Remastered Edition"
     r"\d{4}\s+(remaster(ed)?(\s+edition)?|mix|version)|"
     # Remasters and versions
@@ -110,13 +142,12 @@ _DASH_SUFFIX_PATTERN: Pattern = re.compile(
     r"radio\s+edit|remix|extended|single|"
     # Demo/take patterns
     r"(early\s+)?demo|early\s+take|take\s+\d+|"
-    r"(\w+\s+)*(instrumental|demo|take|rehearsal|rough)|"
+    r"(\w++\s++)*(instrumental|demo|take|rehearsal|rough)|"
     r"(studio\s+)?(guide\s+vocal\s+)?(instrumental\s+)?rough|"
     # Recording session material
     r"sessions?(\s+\w+)*\s*((&|and)\s*)?outtakes?|outtakes?|"
-    r"alternate\s+mix|"
-    # Mix patterns (Sunset Sound Mix, etc.)
-    r"(\w+\s+)+mix|"
+    # Mix patterns (Alternate Mix, Sunset Sound Mix, 2004 Mix, etc.)
+    r"(\w++\s++)+mix|"
     # Live recordings
     r"live(\s+at\s+\w+.*)?|at\s+\w+.*|"
     # Audio formats
@@ -132,33 +163,57 @@ _DASH_SUFFIX_PATTERN: Pattern = re.compile(
     r"shortened\s+edit|vocal\s+version|"
     r"from\s+.+"  # From "Movie" etc
     r").*$",
-    re.IGNORECASE,
 )
 
 # Trailing patterns without dash (e.g., "Song Name demo", "Song Name official video")
 # These appear at the end of the track name without separator
 _TRAILING_SUFFIX_PATTERN: Pattern = re.compile(
-    r"\s+("
-    # Demo/take at end
-    r"demo|"
-    r"take\s+\d+|"
-    r"instrumental|"
+    r"(?<!\s)\s++("
+    # Demo/take and excerpt numbering at end
+    r"demo|instrumental|(take|excerpt)\s+\d+|"
     # Video/audio indicators at end
-    r"official\s+(music\s+)?video|"
-    r"(official\s+)?(hd|4k|animated)\s+video|"
-    r"(official\s+)?lyric\s+video|"
-    r"(official\s+)?visuali[sz]er|"
-    r"official\s+audio|"
+    r"official\s+((music\s+)?video|audio)|"
+    r"(official\s+)?((hd|4k|animated|lyric)\s+video|visuali[sz]er)|"
     # Live location at end (e.g., "at wembley")
     r"at\s+\w+(\s+\w+)*|"
     # Audio format at end
     r"mono|stereo|"
-    # Excerpt numbering
-    r"excerpt\s+\d+|"
     # Dub
     r"dub"
     r")$",
-    re.IGNORECASE,
+)
+
+
+# Bits reported by normalize_text_tagged for each kind of variation found
+TAG_REMASTER = 1 << 0
+TAG_LIVE = 1 << 1
+TAG_VERSION = 1 << 2
+TAG_EXPLICIT = 1 << 3
+TAG_AUDIO_FORMAT = 1 << 4
+TAG_DEMO_TAKE = 1 << 5
+TAG_FEAT = 1 << 6
+TAG_MUSIC_VIDEO = 1 << 7
+
+# Parenthetical and featured-artist patterns with their tag bits, in removal
+# order
+_PARENTHETICAL_PATTERNS: tuple[tuple[int, Pattern], ...] = (
+    (TAG_REMASTER, _REMASTER_PATTERN),
+    (TAG_LIVE, _LIVE_PATTERN),
+    (TAG_VERSION, _VERSION_PATTERN),
+    (TAG_EXPLICIT, _EXPLICIT_PATTERN),
+    (TAG_AUDIO_FORMAT, _AUDIO_FORMAT_PATTERN),
+    (TAG_DEMO_TAKE, _DEMO_TAKE_PATTERN),
+    (TAG_FEAT, _FEAT_PATTERN),
+)
+
+# Every literal any removal pattern needs in order to match. Text without any
+# of these (most clean titles and artist names) skips straight to punctuation
+# and whitespace cleanup.
+_ANY_TRIGGER_PATTERN: Pattern = re.compile(
+    r"[\(\[-]|\d{4}|"
+    r"feat|ft|with|vs|versus|"
+    r"demo|take|instrumental|video|visuali[sz]er|audio|"
+    r"\sat\s|mono|stereo|excerpt|dub",
 )
 
 
@@ -166,80 +221,33 @@ _TRAILING_SUFFIX_PATTERN: Pattern = re.compile(
 # Native Polars expressions for text normalization (faster than map_elements)
 # =============================================================================
 
-# All patterns use (?i) for case-insensitivity (Rust regex inline flag)
+# Polars uses the Rust regex engine, so its patterns are derived from the
+# compiled Python patterns above rather than maintained as a second copy.
+# Rust regex has no possessive quantifiers or lookbehind (it never
+# backtracks, so neither is needed) and takes case-insensitivity as the
+# inline (?i) flag. The removal patterns stay case-insensitive in Polars even
+# though they see lowercased text: Rust's case folding still lets e.g. "ſ"
+# match "s", and the stored track and artist IDs were built that way.
+_PYTHON_ONLY_SYNTAX: Pattern = re.compile(r"(?<=[*+?}])\+|\(\?<!\\s\)")
 
-# Dash-separated suffixes (e.g., "Song - Remastered 2012", "Song - Live at Wembley")
-_POLARS_DASH_SUFFIX = (
-    r"(?i)\s+-\s+("
-    r"\d{4}\s+(remaster(ed)?(\s+edition)?|mix|version)|"
-    r"remaster(ed)?(\s+\d{4}|\s+edition)?|re-master(ed)?|"
-    r"radio\s+edit|remix|extended|single|"
-    r"(early\s+)?demo|early\s+take|take\s+\d+|"
-    r"(\w+\s+)*(instrumental|demo|take|rehearsal|rough)|"
-    r"(studio\s+)?(guide\s+vocal\s+)?(instrumental\s+)?rough|"
-    r"sessions?(\s+\w+)*\s*((&|and)\s*)?outtakes?|outtakes?|"
-    r"alternate\s+mix|"
-    r"(\w+\s+)+mix|"
-    r"live(\s+at\s+\w+.*)?|at\s+\w+.*|"
-    r"mono(\s*/\s*remastered.*)?|stereo|"
-    r"instrumental|acoustic(\s+\w+)*|"
-    r"official\s+(music\s+)?video|music\s+video|"
-    r"official\s+(hd|4k|animated)?\s*video|"
-    r"(official\s+)?lyric\s+video|"
-    r"(hd|4k)\s+video|visuali[sz]er|official\s+audio|"
-    r"shortened\s+edit|vocal\s+version|"
-    r"from\s+.+"
-    r").*$"
-)
 
-# Parenthetical patterns - content in () or []
-_POLARS_REMASTER = r"(?i)\s*[\(\[](remaster(ed)?|re-master(ed)?|\d{4}\s+remaster(ed)?|remaster(ed)?\s+\d{4})[\)\]]"
-_POLARS_LIVE = r"(?i)\s*[\(\[]((live|live\s+(at|from|in|on)|live\s+\d{4}|live\s+(version|recording)).*?)[\)\]]"
-_POLARS_VERSION = r"(?i)\s*[\(\[](.*?\s+(version|mix|edit|remix|take)|single\s+version|album\s+version|radio\s+edit|extended(\s+(version|mix|edit))?|remix)[\)\]]"
-_POLARS_EXPLICIT = r"(?i)\s*[\(\[](explicit|clean|censored)[\)\]]"
-_POLARS_AUDIO_FORMAT = r"(?i)\s*[\(\[]((stereo|mono)(\s+(mix|version))?|original\s+(stereo|mono)|true\s+stereo|simulated\s+stereo)[\)\]]"
-_POLARS_DEMO_TAKE = (
-    r"(?i)\s*[\(\[]("
-    r"demo|early\s+demo|"
-    r"take\s+\d+|early\s+take|"
-    r"instrumental|acoustic|"
-    r"(.*\s*-\s*)?(official\s+)?(music\s+)?video|"
-    r"(.*\s*-\s*)?(official\s+)?(hd|4k|animated(\s+music)?|animated)?\s*video|"
-    r"(.*\s*-\s*)?(official\s+)?lyric\s+video|"
-    r"(.*\s*-\s*)?visuali[sz]er|"
-    r"(.*\s*-\s*)?official\s+audio|"
-    r"outtakes?|sessions?|"
-    r"alternate|"
-    r"dub"
-    r")[\)\]]"
-)
-_POLARS_FEAT = r"(?i)\s*[\(\[]?(feat\.?|ft\.?|featuring|with|vs\.?|versus).*?[\)\]]?$"
-_POLARS_YEAR = r"\s*[\(\[]?\d{4}[\)\]]?\s*"
-
-# Trailing suffixes without dash
-_POLARS_TRAILING = (
-    r"(?i)\s+("
-    r"demo|"
-    r"take\s+\d+|"
-    r"instrumental|"
-    r"official\s+(music\s+)?video|"
-    r"(official\s+)?(hd|4k|animated)\s+video|"
-    r"(official\s+)?lyric\s+video|"
-    r"(official\s+)?visuali[sz]er|"
-    r"official\s+audio|"
-    r"at\s+\w+(\s+\w+)*|"
-    r"mono|stereo|"
-    r"excerpt\s+\d+|"
-    r"dub"
-    r")$"
-)
+def _polars_pattern(pattern: Pattern, ignore_case: bool = False) -> str:
+    """Translate a compiled Python pattern to Rust regex syntax for Polars."""
+    translated = _PYTHON_ONLY_SYNTAX.sub("", pattern.pattern)
+    if ignore_case or pattern.flags & re.IGNORECASE:
+        translated = "(?i)" + translated
+    return translated
 
-# Punctuation (keep hyphens for "hip-hop" etc)
-_POLARS_PUNCTUATION = r"[^\w\s-]"
-_POLARS_WHITESPACE = r"\s+"
 
-# Music video detection pattern
-_POLARS_MUSIC_VIDEO = r"(?i)(music\s+video|official\s+video|video\s+clip|visuali[sz]er|lyric\s+video|official\s+audio)"
+_POLARS_DASH_SUFFIX = _polars_pattern(_DASH_SUFFIX_PATTERN, ignore_case=True)
+_POLARS_PARENTHETICALS = tuple(
+    _polars_pattern(pattern, ignore_case=True) for _, pattern in _PARENTHETICAL_PATTERNS
+)
+_POLARS_YEAR = _polars_pattern(_YEAR_PATTERN)
+_POLARS_TRAILING = _polars_pattern(_TRAILING_SUFFIX_PATTERN, ignore_case=True)
+_POLARS_PUNCTUATION = _polars_pattern(_PUNCTUATION_PATTERN)
+_POLARS_WHITESPACE = _polars_pattern(_WHITESPACE_PATTERN)
+_POLARS_MUSIC_VIDEO = _polars_pattern(_MUSIC_VIDEO_PATTERN)
 
 
 def normalize_text_expr(col: str | pl.Expr) -> pl.Expr:
@@ -264,20 +272,18 @@ def normalize_text_expr(col: str | pl.Expr) -> pl.Expr:
     else:
         expr = col
 
-    return (
+    expr = (
         expr.str.to_lowercase()
         .str.strip_chars()
         # Remove dash-separated suffixes first
         .str.replace_all(_POLARS_DASH_SUFFIX, "")
-        # Remove parenthetical patterns
-        .str.replace_all(_POLARS_REMASTER, "")
-        .str.replace_all(_POLARS_LIVE, "")
-        .str.replace_all(_POLARS_VERSION, "")
-        .str.replace_all(_POLARS_EXPLICIT, "")
-        .str.replace_all(_POLARS_AUDIO_FORMAT, "")
-        .str.replace_all(_POLARS_DEMO_TAKE, "")
-        .str.replace_all(_POLARS_FEAT, "")
-        .str.replace_all(_POLARS_YEAR, "")
+    )
+    # Remove parenthetical patterns and featured artists, in order
+    for pattern in _POLARS_PARENTHETICALS:
+        expr = expr.str.replace_all(pattern, "")
+
+    return (
+        expr.str.replace_all(_POLARS_YEAR, "")
         # Remove trailing suffixes
         .str.replace_all(_POLARS_TRAILING, "")
         # Remove punctuation except hyphens
@@ -290,6 +296,35 @@ def normalize_text_expr(col: str | pl.Expr) -> pl.Expr:
     )
 
 
+def normalize_text_batch(texts: list[str]) -> list[str]:
+    """
+    Normalize many strings in one call using the native Polars expression.
+
+    Matches normalize_text_expr(), which builds the stored track and artist
+    IDs, so names normalized here line up with those IDs. Missing values
+    normalize to "". The output can differ from normalize_text() on some
+    non-ASCII text, because Python and Rust handle Unicode differently:
+    normalize_text("İstanbul") gives 'istanbul', but this gives 'i̇stanbul'.
+
+    Args:
+        texts: Track or artist names to normalize
+
+    Returns:
+        Normalized texts, in the same order
+
+    Examples:
+        >>> normalize_text_batch(["Song (Live)", "Track - Radio Edit"])
+        ['song', 'track']
+    """
+    return (
+        pl.Series("text", texts, dtype=pl.String)
+        .to_frame()
+        .select(normalize_text_expr("text").fill_null(""))
+        .to_series()
+        .to_list()
+    )
+
+
 def generate_canonical_track_id_expr(
     track_col: str | pl.Expr, artist_col: str | pl.Expr
 ) -> pl.Expr:
@@ -355,9 +390,78 @@ def is_music_video_expr(col: str | pl.Expr) -> pl.Expr:
     else:
         expr = col
 
+    # One case-insensitive regex scan beats lowercasing plus per-phrase literal
+    # contains (or contains_any), and keeps the \s+ flexibility of the pattern
     return expr.str.contains(_POLARS_MUSIC_VIDEO)
 
 
+def _lower(text: str) -> str:
+    """Lowercase text, skipping the copy when it is already lowercase ASCII."""
+    if text.isascii() and text.islower():
+        return text
+    return text.lower()
+
+
+def _remove_punctuation(text: str) -> str:
+    """Remove punctuation except hyphens, using str.translate for ASCII text."""
+    if text.isascii():
+        return text.translate(_ASCII_PUNCTUATION_TABLE)
+    return _PUNCTUATION_PATTERN.sub("", text)
+
+
+def _normalize(text: str) -> tuple[str, int]:
+    """Normalize text, also returning the TAG_* bits of the patterns removed."""
+    if not text:
+        return "", 0
+
+    # Lowercase and strip
+    text = _lower(text).strip()
+
+    if not _ANY_TRIGGER_PATTERN.search(text):
+        text = _remove_punctuation(text)
+        return " ".join(text.split()), 0
+
+    # Cheap substring checks for the literal anchors of the dash and bracket
+    # patterns, so those regexes only run on text that can actually match
+    has_dash = "-" in text
+    has_bracket = "(" in text or "[" in text
+
+    # Remove dash-separated suffixes FIRST (before year removal breaks them)
+    # e.g., "Song - 2004 Remastered Edition" should be caught here
+    if has_dash:
+        text = _DASH_SUFFIX_PATTERN.sub("", text)
+
+    # Remove parenthetical patterns and featured artists. Every pattern but
+    # the featured-artist one needs an opening bracket, so unbracketed text
+    # only has to be checked for featured artists.
+    tags = 0
+    if not has_bracket:
+        text, count = _FEAT_PATTERN.subn("", text)
+        if count:
+            tags |= TAG_FEAT
+    else:
+        for tag, pattern in _PARENTHETICAL_PATTERNS:
+            text, count = pattern.subn("", text)
+            if count:
+                tags |= tag
+    text = _YEAR_PATTERN.sub("", text)
+
+    # Remove trailing suffixes without dash (e.g., "Song Name demo")
+    text = _TRAILING_SUFFIX_PATTERN.sub("", text)
+
+    # Remove punctuation except hyphens (keep "hip-hop", etc.)
+    text = _remove_punctuation(text)
+
+    # After punctuation removal, try dash suffix again for malformed cases
+    # e.g., "Song - (Instrumental" becomes "Song - Instrumental" after punct removal
+    if has_dash:
+        text = _DASH_SUFFIX_PATTERN.sub("", text)
+
+    # Collapse whitespace runs and strip the ends (str.split() splits on the
+    # same Unicode whitespace as \s)
+    return " ".join(text.split()), tags
+
+
 def normalize_text(text: str) -> str:
     """
     Normalize text for fuzzy matching by removing variations.
@@ -365,6 +469,9 @@ def normalize_text(text: str) -> str:
     Removes common suffixes like "(Remastered)", "(Live)", version indicators,
     featured artists, years, punctuation, and normalizes whitespace.
 
+    For single strings. Normalize DataFrame columns with normalize_text_expr()
+    and Python lists with normalize_text_batch() instead of calling this per row.
+
     Args:
         text: Track or artist name to normalize
 
@@ -385,46 +492,40 @@ def normalize_text(text: str) -> str:
         >>> normalize_text("Song Name official video")
         'song name'
     """
-    if not text:
-        return ""
-
-    # Lowercase and strip
-    text = text.lower().strip()
+    return _normalize(text)[0]
 
-    # Remove dash-separated suffixes FIRST (before year removal breaks them)
-    # e.g., "Song - 2004 Remastered Edition" should be caught here
-    text = _DASH_SUFFIX_PATTERN.sub("", text)
-
-    # Remove parenthetical patterns
-    text = _REMASTER_PATTERN.sub("", text)
-    text = _LIVE_PATTERN.sub("", text)
-    text = _VERSION_PATTERN.sub("", text)
-    text = _EXPLICIT_PATTERN.sub("", text)
-    text = _AUDIO_FORMAT_PATTERN.sub("", text)
-    text = _DEMO_TAKE_PATTERN.sub("", text)
-    text = _FEAT_PATTERN.sub("", text)
-    text = _YEAR_PATTERN.sub("", text)
 
-    # Remove trailing suffixes without dash (e.g., "Song Name demo")
-    text = _TRAILING_SUFFIX_PATTERN.sub("", text)
+def normalize_text_tagged(text: str) -> tuple[str, int]:
+    """
+    Normalize text and report which kinds of variation were found.
 
-    # Remove punctuation except hyphens (keep "hip-hop", etc.)
-    text = _PUNCTUATION_PATTERN.sub("", text)
+    Tags come from the bracketed and featured-artist patterns removed during
+    normalization, plus TAG_MUSIC_VIDEO when is_music_video() would be True.
 
-    # After punctuation removal, try dash suffix again for malformed cases
-    # e.g., "Song - (Instrumental" becomes "Song - Instrumental" after punct removal
-    text = _DASH_SUFFIX_PATTERN.sub("", text)
+    Args:
+        text: Track name to normalize
 
-    # Normalize whitespace
-    text = _WHITESPACE_PATTERN.sub(" ", text)
+    Returns:
+        Tuple of (normalized text, bitmask of TAG_* constants)
 
-    return text.strip()
+    Examples:
+        >>> normalize_text_tagged("Song (Live) (feat. Artist)")
+        ('song', 66)
+        >>> normalize_text_tagged("Song (Official Video)")
+        ('song', 160)
+    """
+    normalized, tags = _normalize(text)
+    if text and _MUSIC_VIDEO_PATTERN.search(text):
+        tags |= TAG_MUSIC_VIDEO
+    return normalized, tags
 
 
 def is_music_video(track_name: str) -> bool:
     """
     Detect if a track name indicates a music video version.
 
+    For single strings. Use is_music_video_expr() for DataFrame columns.
+
     Args:
         track_name: Track name to check
 
@@ -450,6 +551,8 @@ def generate_canonical_track_id(track_name: str, artist_name: str) -> str:
     Generate canonical track ID from normalized track and artist names.
 
     Uses pipe separator to combine normalized names into stable ID.
+    For single pairs. Use generate_canonical_track_id_expr() for DataFrame
+    columns.
 
     Args:
         track_name: Track name (will be normalized)
@@ -470,16 +573,19 @@ def generate_canonical_track_id(track_name: str, artist_name: str) -> str:
     # Handle edge case where normalization removes everything
     if not normalized_track or not normalized_artist:
         # Fallback to original text if normalization produces empty string
-        normalized_track = normalized_track or track_name.lower().strip()
-        normalized_artist = normalized_artist or artist_name.lower().strip()
+        normalized_track = normalized_track or _lower(track_name).strip()
+        normalized_artist = normalized_artist or _lower(artist_name).strip()
 
-    return f"{normalized_track}|{normalized_artist}"
+    return normalized_track + "|" + normalized_artist
 
 
 def generate_canonical_artist_id(artist_name: str) -> str:
     """
     Generate canonical artist ID from normalized artist name.
 
+    For single names. Use generate_canonical_artist_id_expr() for DataFrame
+    columns.
+
     Args:
         artist_name: Artist name (will be normalized)
 
@@ -496,6 +602,6 @@ def generate_canonical_artist_id(artist_name: str) -> str:
 
     # Handle edge case where normalization removes everything
     if not normalized:
-        normalized = artist_name.lower().strip()
+        normalized = _lower(artist_name).strip()
 
     return normalized
@@ -6,7 +6,10 @@ Prioritizes songs (audio-only) over music videos.
 Includes retry logic with exponential backoff for rate limiting.
 """
 
+import asyncio
 import logging
+import os
+import threading
 from json import JSONDecodeError
 from typing import Optional
 
@@ -21,21 +24,30 @@ from ytmusicapi import YTMusic
 
 logger = logging.getLogger(__name__)
 
-# Global YTMusic instance (lazy initialized)
-_ytmusic: Optional[YTMusic] = None
+# Searches in flight at once for batch lookups. ytmusicapi is synchronous, so
+# each search runs in a worker thread (with that thread's own client).
+_MAX_CONCURRENT_SEARCHES = 8
+
+# Per-thread YTMusic instances (lazy initialized). Each client keeps its own
+# requests.Session, so reusing it keeps the connection alive between searches;
+# sessions are not thread-safe, so threads do not share one.
+_local = threading.local()
 
 
 def _get_ytmusic(force_new: bool = False) -> Optional[YTMusic]:
-    """Get or initialize YTMusic client."""
-    global _ytmusic
-    if _ytmusic is None or force_new:
+    """Get or initialize the current thread's YTMusic client."""
+    # A client inherited through fork would share its connections with the
+    # parent process, so forked workers create their own
+    pid = os.getpid()
+    if force_new or getattr(_local, "pid", None) != pid:
         try:
-            _ytmusic = YTMusic()
+            _local.client = YTMusic()
+            _local.pid = pid
             logger.info("YTMusic client initialized")
         except Exception as e:
             logger.warning(f"Failed to initialize YTMusic: {e}")
             return None
-    return _ytmusic
+    return _local.client
 
 
 def _log_retry_with_query(retry_state: RetryCallState) -> None:
@@ -132,3 +144,29 @@ def search_youtube_video_id(track_name: str, artist_name: str) -> Optional[str]:
         logger.warning(f"YTMusic search error for '{query}': {e}")
 
     return None
+
+
+async def search_youtube_urls(
+    pairs: list[tuple[str, str]],
+    max_concurrency: int = _MAX_CONCURRENT_SEARCHES,
+) -> list[str | None]:
+    """
+    Search YouTube Music for many tracks concurrently.
+
+    Runs search_youtube_url for each pair in worker threads, with at most
+    max_concurrency searches in flight to stay clear of rate limits.
+
+    Args:
+        pairs: (track_name, artist_name) pairs to search
+        max_concurrency: Maximum number of concurrent searches
+
+    Returns:
+        YouTube URL or None for each pair, in the same order
+    """
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def search(track_name: str, artist_name: str) -> str | None:
+        async with semaphore:
+            return await asyncio.to_thread(search_youtube_url, track_name, artist_name)
+
+    return await asyncio.gather(*(search(track, artist) for track, artist in pairs))
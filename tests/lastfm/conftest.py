@@ -11,236 +11,151 @@ from typing import Any
 import pytest
 
 
-@pytest.fixture
-def sample_tracks_response() -> dict[str, Any]:
-    """Sample Last.fm API response for user.getrecenttracks."""
+def _track(
+    name: str,
+    artist: str,
+    uts: int | None,
+    *,
+    mbid: str = "",
+    artist_mbid: str = "",
+    album: str = "",
+    album_mbid: str = "",
+    loved: str | None = None,
+) -> dict[str, Any]:
+    """Build a recent-track entry; uts=None makes it the "now playing" track."""
+    track: dict[str, Any] = {
+        "artist": {"mbid": artist_mbid, "name": artist},
+        "mbid": mbid,
+        "name": name,
+        "album": {"mbid": album_mbid, "#text": album},
+        "url": "https://www.last.fm/music/"
+        f"{artist.replace(' ', '+')}/_/{name.replace(' ', '+')}",
+    }
+    if loved is not None:
+        track["loved"] = loved
+    if uts is None:
+        track["@attr"] = {"nowplaying": "true"}
+    else:
+        played_at = dt.datetime.fromtimestamp(uts, tz=dt.UTC)
+        track["date"] = {
+            "uts": str(uts),
+            "#text": played_at.strftime("%d %b %Y, %H:%M"),
+        }
+    return track
+
+
+def _recent_tracks(
+    tracks: list[dict[str, Any]] | dict[str, Any],
+    *,
+    page: int = 1,
+    total_pages: int = 1,
+    per_page: int = 200,
+    total: int | None = None,
+) -> dict[str, Any]:
+    """Wrap tracks in a user.getrecenttracks response envelope."""
+    if total is None:
+        total = len(tracks) if isinstance(tracks, list) else 1
     return {
         "recenttracks": {
             "@attr": {
                 "user": "testuser",
-                "totalPages": "1",
-                "page": "1",
-                "perPage": "200",
-                "total": "3",
+                "totalPages": str(total_pages),
+                "page": str(page),
+                "perPage": str(per_page),
+                "total": str(total),
             },
-            "track": [
-                {
-                    "artist": {
-                        "mbid": "a74b1b7f-71a5-4011-9441-d0b5e4122711",
-                        "name": "Radiohead",
-                    },
-                    "mbid": "6b9a509f-6907-4a6e-9345-2f12da09ba4b",
-                    "name": "Creep",
-                    "album": {
-                        "mbid": "b2c9e8b0-5a8c-4e76-8b1f-3f9b0c8f1b0e",
-                        "#text": "Pablo Honey",
-                    },
-                    "url": "https://www.last.fm/music/Radiohead/_/Creep",
-                    "date": {
-                        "uts": "1609459200",  # 2021-01-01 00:00:00 UTC
-                        "#text": "01 Jan 2021, 00:00",
-                    },
-                },
-                {
-                    "artist": {
-                        "mbid": "",
-                        "name": "The Beatles",
-                    },
-                    "mbid": "",
-                    "name": "Yesterday",
-                    "album": {
-                        "mbid": "",
-                        "#text": "Help!",
-                    },
-                    "url": "https://www.last.fm/music/The+Beatles/_/Yesterday",
-                    "date": {
-                        "uts": "1609462800",  # 2021-01-01 01:00:00 UTC
-                        "#text": "01 Jan 2021, 01:00",
-                    },
-                },
-                {
-                    "artist": {
-                        "mbid": "ba0d6274-db14-4ef5-b28d-657ebde1a396",
-                        "name": "The Rolling Stones",
-                    },
-                    "mbid": "e4feb630-fe7c-4f8d-8a72-05b65e2e51b0",
-                    "name": "Paint It Black",
-                    "album": {
-                        "mbid": "c1b0e8b0-5a8c-4e76-8b1f-3f9b0c8f1b0e",
-                        "#text": "Aftermath",
-                    },
-                    "url": "https://www.last.fm/music/The+Rolling+Stones/_/Paint+It+Black",
-                    "date": {
-                        "uts": "1609466400",  # 2021-01-01 02:00:00 UTC
-                        "#text": "01 Jan 2021, 02:00",
-                    },
-                },
-            ],
+            "track": tracks,
         }
     }
 
 
+def _creep(uts: int | None = 1609459200, name: str = "Creep") -> dict[str, Any]:
+    """Radiohead track with MBIDs (Creep from Pablo Honey, else OK Computer)."""
+    return _track(
+        name,
+        "Radiohead",
+        uts,
+        mbid="6b9a509f-6907-4a6e-9345-2f12da09ba4b",
+        artist_mbid="a74b1b7f-71a5-4011-9441-d0b5e4122711",
+        album="Pablo Honey" if name == "Creep" else "OK Computer",
+        album_mbid="b2c9e8b0-5a8c-4e76-8b1f-3f9b0c8f1b0e",
+    )
+
+
+@pytest.fixture
+def sample_tracks_response() -> dict[str, Any]:
+    """Sample Last.fm API response for user.getrecenttracks."""
+    return _recent_tracks(
+        [
+            _creep(1609459200),  # 2021-01-01 00:00:00 UTC
+            _track("Yesterday", "The Beatles", 1609462800, album="Help!"),
+            _track(
+                "Paint It Black",
+                "The Rolling Stones",
+                1609466400,
+                mbid="e4feb630-fe7c-4f8d-8a72-05b65e2e51b0",
+                artist_mbid="ba0d6274-db14-4ef5-b28d-657ebde1a396",
+                album="Aftermath",
+                album_mbid="c1b0e8b0-5a8c-4e76-8b1f-3f9b0c8f1b0e",
+            ),
+        ]
+    )
+
+
 @pytest.fixture
 def sample_single_track_response() -> dict[str, Any]:
     """Sample Last.fm API response with a single track (dict, not list)."""
-    return {
-        "recenttracks": {
-            "@attr": {
-                "user": "testuser",
-                "totalPages": "1",
-                "page": "1",
-                "perPage": "200",
-                "total": "1",
-            },
-            "track": {
-                "artist": {
-                    "mbid": "a74b1b7f-71a5-4011-9441-d0b5e4122711",
-                    "name": "Radiohead",
-                },
-                "mbid": "6b9a509f-6907-4a6e-9345-2f12da09ba4b",
-                "name": "Creep",
-                "album": {
-                    "mbid": "b2c9e8b0-5a8c-4e76-8b1f-3f9b0c8f1b0e",
-                    "#text": "Pablo Honey",
-                },
-                "url": "https://www.last.fm/music/Radiohead/_/Creep",
-                "date": {
-                    "uts": "1609459200",
-                    "#text": "01 Jan 2021, 00:00",
-                },
-            },
-        }
-    }
+    return _recent_tracks(_creep(1609459200))
 
 
 @pytest.fixture
 def sample_now_playing_response() -> dict[str, Any]:
     """Sample Last.fm API response with a 'now playing' track (should be filtered)."""
-    return {
-        "recenttracks": {
-            "@attr": {
-                "user": "testuser",
-                "totalPages": "1",
-                "page": "1",
-                "perPage": "200",
-                "total": "2",
-            },
-            "track": [
-                {
-                    "artist": {
-                        "mbid": "a74b1b7f-71a5-4011-9441-d0b5e4122711",
-                        "name": "Radiohead",
-                    },
-                    "mbid": "6b9a509f-6907-4a6e-9345-2f12da09ba4b",
-                    "name": "No Surprises",
-                    "album": {
-                        "mbid": "b2c9e8b0-5a8c-4e76-8b1f-3f9b0c8f1b0e",
-                        "#text": "OK Computer",
-                    },
-                    "url": "https://www.last.fm/music/Radiohead/_/No+Surprises",
-                    "@attr": {"nowplaying": "true"},
-                    # No "date" field for now playing tracks
-                },
-                {
-                    "artist": {
-                        "mbid": "a74b1b7f-71a5-4011-9441-d0b5e4122711",
-                        "name": "Radiohead",
-                    },
-                    "mbid": "6b9a509f-6907-4a6e-9345-2f12da09ba4b",
-                    "name": "Creep",
-                    "album": {
-                        "mbid": "b2c9e8b0-5a8c-4e76-8b1f-3f9b0c8f1b0e",
-                        "#text": "Pablo Honey",
-                    },
-                    "url": "https://www.last.fm/music/Radiohead/_/Creep",
-                    "date": {
-                        "uts": "1609459200",
-                        "#text": "01 Jan 2021, 00:00",
-                    },
-                },
-            ],
-        }
-    }
+    # "Now playing" tracks have no "date" field
+    return _recent_tracks([_creep(None, name="No Surprises"), _creep(1609459200)])
 
 
 @pytest.fixture
 def sample_empty_response() -> dict[str, Any]:
     """Sample Last.fm API response with no tracks."""
-    return {
-        "recenttracks": {
-            "@attr": {
-                "user": "testuser",
-                "totalPages": "0",
-                "page": "1",
-                "perPage": "200",
-                "total": "0",
-            },
-            "track": [],
-        }
-    }
+    return _recent_tracks([], total_pages=0)
+
+
+def _numbered_track(n: int, uts: int, loved: str) -> dict[str, Any]:
+    """Track n by artist n, as used in the pagination responses."""
+    return _track(
+        f"Track {n}",
+        f"Artist {n}",
+        uts,
+        mbid=f"track{n}",
+        artist_mbid=f"artist{n}",
+        album=f"Album {n}",
+        album_mbid=f"album{n}",
+        loved=loved,
+    )
 
 
 @pytest.fixture
 def sample_paginated_response_page1() -> dict[str, Any]:
     """Sample Last.fm API response for pagination test - page 1."""
-    return {
-        "recenttracks": {
-            "@attr": {
-                "user": "testuser",
-                "totalPages": "2",
-                "page": "1",
-                "perPage": "2",
-                "total": "3",
-            },
-            "track": [
-                {
-                    "artist": {"mbid": "artist1", "name": "Artist 1"},
-                    "mbid": "track1",
-                    "name": "Track 1",
-                    "album": {"mbid": "album1", "#text": "Album 1"},
-                    "url": "https://www.last.fm/music/Artist+1/_/Track+1",
-                    "loved": "1",
-                    "date": {"uts": "1609459200", "#text": "01 Jan 2021, 00:00"},
-                },
-                {
-                    "artist": {"mbid": "artist2", "name": "Artist 2"},
-                    "mbid": "track2",
-                    "name": "Track 2",
-                    "album": {"mbid": "album2", "#text": "Album 2"},
-                    "url": "https://www.last.fm/music/Artist+2/_/Track+2",
-                    "loved": "0",
-                    "date": {"uts": "1609462800", "#text": "01 Jan 2021, 01:00"},
-                },
-            ],
-        }
-    }
+    return _recent_tracks(
+        [_numbered_track(1, 1609459200, "1"), _numbered_track(2, 1609462800, "0")],
+        total_pages=2,
+        per_page=2,
+        total=3,
+    )
 
 
 @pytest.fixture
 def sample_paginated_response_page2() -> dict[str, Any]:
     """Sample Last.fm API response for pagination test - page 2."""
-    return {
-        "recenttracks": {
-            "@attr": {
-                "user": "testuser",
-                "totalPages": "2",
-                "page": "2",
-                "perPage": "2",
-                "total": "3",
-            },
-            "track": [
-                {
-                    "artist": {"mbid": "artist3", "name": "Artist 3"},
-                    "mbid": "track3",
-                    "name": "Track 3",
-                    "album": {"mbid": "album3", "#text": "Album 3"},
-                    "url": "https://www.last.fm/music/Artist+3/_/Track+3",
-                    "loved": "0",
-                    "date": {"uts": "1609466400", "#text": "01 Jan 2021, 02:00"},
-                },
-            ],
-        }
-    }
+    return _recent_tracks(
+        [_numbered_track(3, 1609466400, "0")],
+        page=2,
+        total_pages=2,
+        per_page=2,
+        total=3,
+    )
 
 
 @pytest.fixture
@@ -6,11 +6,13 @@ and create minimal Delta tables under ./data/* so no real data is touched.
 Last.fm API client is mocked to avoid network calls.
 """
 
+import shutil
 from pathlib import Path
-from unittest.mock import patch
+from unittest.mock import AsyncMock, MagicMock
 
 import polars as pl
 import pytest
+from polars.testing import assert_frame_equal
 
 from music_airflow.utils.polars_io_manager import PolarsDeltaIOManager
 
@@ -22,87 +24,336 @@ from music_airflow.transform.candidate_generation import (
 )
 
 
+# Plays: one user with a played track (track_id format: "track|artist" normalized)
+_PLAYS_DF = pl.DataFrame(
+    {
+        "username": ["user1"],
+        "track_id": ["known|artist a"],  # normalized
+    }
+)
+
+# Tracks: map track_id -> artist_id and include tags
+_TRACKS_DF = pl.DataFrame(
+    {
+        "track_id": [
+            "known|artist a",  # normalized
+            "new track|artist b",
+            "tag track|artist c",
+        ],
+        "artist_id": ["a1", "b1", "c1"],
+    }
+)
+
+# Artists: map artist_id -> artist_name and tags
+# Include artist_mbid for deep cut filtering
+_ARTISTS_DF = pl.DataFrame(
+    {
+        "artist_id": ["a1", "b1", "c1"],
+        "artist_name": ["Artist A", "Artist B", "Artist C"],
+        "artist_mbid": ["a_mbid", "b_mbid", "c_mbid"],
+        "tags": ["rock,indie,alt", "indie", "rock"],
+    }
+)
+
+# Gold artist_play_count: user's play stats for each artist
+_ARTIST_PC_DF = pl.DataFrame(
+    {
+        "username": ["user1", "user1", "user1"],
+        "artist_id": ["a1", "b1", "c1"],
+        "artist_name": ["Artist A", "Artist B", "Artist C"],
+        "play_count": [10, 5, 3],
+    }
+)
+
+# merge_candidate_sources: plays table (empty for this user to not filter candidates)
+_MERGE_PLAYS_DF = pl.DataFrame(
+    {
+        "username": ["user1"],
+        "track_id": ["some_other_track"],
+    }
+)
+
+# Dimension tables needed for joins
+_MERGE_TRACKS_DF = pl.DataFrame(
+    {
+        "track_id": ["artist b::new track", "artist c::tag track"],
+        "track_name": ["New Track", "Tag Track"],
+        "track_mbid": ["tmbid", "tm2"],
+        "artist_name": ["Artist B", "Artist C"],
+        "artist_id": ["b1", "c1"],
+        "duration_ms": [180000, 240000],
+        "tags": ["rock,indie", "rock,pop"],
+        "listeners": [5000, 6000],
+        "playcount": [10000, 6000],
+        "youtube_url": [
+            "https://youtube.com/watch?v=1",
+            "https://youtube.com/watch?v=2",
+        ],
+        "spotify_url": [
+            "https://open.spotify.com/track/1",
+            "https://open.spotify.com/track/2",
+        ],
+    }
+)
+
+_MERGE_ARTISTS_DF = pl.DataFrame(
+    {
+        "artist_id": ["a1", "b1", "c1"],
+        "artist_name": ["Artist A", "Artist B", "Artist C"],
+        "artist_mbid": ["ambid", "bmbid", "cmbid"],
+    }
+)
+
+# Synthetic silver candidate tables with updated schema (includes artist_mbid)
+_SIMILAR_ARTIST_DF = pl.DataFrame(
+    {
+        "username": ["user1"],
+        "track_id": ["artist b::new track"],
+        "track_name": ["New Track"],
+        "artist_name": ["Artist B"],
+        "track_mbid": ["tmbid"],
+        "artist_mbid": ["bmbid"],
+        "score": [10000],
+        "similarity": [0.85],
+        "source_artist_id": ["a1"],
+    }
+)
+
+_SIMILAR_TAG_DF = pl.DataFrame(
+    {
+        "username": ["user1", "user1"],
+        "track_id": ["artist b::new track", "artist c::tag track"],
+        "track_name": ["New Track", "Tag Track"],
+        "artist_name": ["Artist B", "Artist C"],
+        "track_mbid": ["tmbid", "tm2"],
+        "artist_mbid": ["bmbid", "cmbid"],
+        "tag_match_count": [3, 4],
+        "avg_rank": [5.0, 3.0],
+        "score": [3095.0, 4097.0],
+        "source_tags": ["rock,indie,alt", "rock,indie,alt,pop"],
+    }
+)
+
+_DEEP_CUT_DF = pl.DataFrame(
+    {
+        "username": ["user1"],
+        "track_id": ["artist c::tag track"],
+        "track_name": ["Tag Track"],
+        "artist_name": ["Artist C"],
+        "track_mbid": ["tm2"],
+        "artist_mbid": ["cmbid"],
+        "score": [6000.0],
+        "source_artist_id": ["c1"],
+    }
+)
+
+
+# Canned Last.fm responses for the generator tests
+# Similar artists for Artist A: include a clone (match>0.9) which should be filtered
+_SIMILAR_ARTISTS_A = [
+    {"name": "Artist B", "match": 0.5},
+    {"name": "Artist A", "match": 0.95},  # filtered out
+]
+
+# Top tracks for Artist B: include one below min_listeners to be filtered
+_TOP_TRACKS_B = [
+    {
+        "name": "New Track",
+        "mbid": "tmbid",
+        "artist": {"name": "Artist B", "mbid": "bmbid"},
+        "listeners": 5000,
+        "playcount": 10000,
+    },
+    {
+        "name": "Too Small",
+        "mbid": "",
+        "artist": {"name": "Artist B", "mbid": "bmbid"},
+        "listeners": 10,
+        "playcount": 20,
+    },
+]
+
+# Top tracks for each tag (rock, indie, alt)
+# Track A appears in multiple tags (meets min_tag_matches=3)
+# Track B appears in only 1 tag (filtered out)
+_TAG_TOP_TRACKS = {
+    "rock": [
+        {
+            "name": "Rock Track A",
+            "mbid": "rta_mbid",
+            "artist": {"name": "Artist D", "mbid": "d_mbid"},
+            "@attr": {"rank": "1"},
+        },
+        {
+            "name": "Rock Track B",
+            "mbid": "rtb_mbid",
+            "artist": {"name": "Artist E", "mbid": "e_mbid"},
+            "@attr": {"rank": "2"},
+        },
+    ],
+    "indie": [
+        {
+            "name": "Rock Track A",  # Same track, different tag
+            "mbid": "rta_mbid",
+            "artist": {"name": "Artist D", "mbid": "d_mbid"},
+            "@attr": {"rank": "3"},
+        },
+    ],
+    "alt": [
+        {
+            "name": "Rock Track A",  # Same track, third tag
+            "mbid": "rta_mbid",
+            "artist": {"name": "Artist D", "mbid": "d_mbid"},
+            "@attr": {"rank": "5"},
+        },
+    ],
+}
+
+# Top albums only for Artist A; other artists have no albums above threshold
+_TOP_ALBUMS = {
+    "Artist A": [
+        {"name": "Album One", "playcount": 10000, "artist": {"mbid": "a_mbid"}},
+        {"name": "Album Two", "playcount": 1000000, "artist": {"mbid": "a_mbid"}},
+    ],
+}
+
+# Album track lists, including one track that was already played
+_ALBUM_INFO = {
+    "Album One": {
+        "tracks": {
+            "track": [
+                {"name": "Hidden Gem", "mbid": "hg_mbid"},
+                {"name": "Known", "mbid": ""},
+            ]
+        }
+    },
+    "Album Two": {"tracks": {"track": [{"name": "Popular Track", "mbid": "pt_mbid"}]}},
+}
+
+# Expected generator outputs (only the asserted columns)
+# Only New Track should remain (clone and small filtered); uses canonical ID
+_EXPECTED_SIMILAR_ARTIST = pl.DataFrame(
+    {"track_id": ["new track|artist b"], "username": ["user1"]}
+)
+
+# Both Hidden Gem and Popular Track should be included (no max_listeners filter)
+# Known|Artist A is filtered because already played
+_EXPECTED_DEEP_CUT = pl.DataFrame(
+    {"track_id": ["hidden gem|artist a", "popular track|artist a"]}
+)
+
+
+def _delta_io_factory(data_dir: Path):
+    """Build an IO manager factory with base_uri pointing to data_dir subfolders."""
+    managers = {}
+    for layer in ("silver", "gold"):
+        managers[layer] = PolarsDeltaIOManager(medallion_layer=layer)
+        managers[layer].base_uri = str(data_dir / layer)
+
+    def factory(medallion_layer: str = "silver"):
+        return managers[medallion_layer]
+
+    return factory
+
+
 @pytest.fixture
-def patched_delta_io(test_data_dir):
+def patched_delta_io(test_data_dir, monkeypatch):
     """Provide patched IO managers with base_uri pointing to test_data_dir subfolders."""
-    silver_mgr = PolarsDeltaIOManager(medallion_layer="silver")
-    silver_mgr.base_uri = str(test_data_dir / "silver")
+    factory = _delta_io_factory(test_data_dir)
+    monkeypatch.setattr(
+        "music_airflow.transform.candidate_generation.PolarsDeltaIOManager", factory
+    )
+    return factory
+
+
+@pytest.fixture
+def mock_lastfm_client(monkeypatch):
+    """Patch LastFMClient so `async with LastFMClient()` yields an AsyncMock."""
+    client = AsyncMock()
+    client.__aenter__.return_value = client
+    client.__aexit__.return_value = None
+    monkeypatch.setattr(
+        "music_airflow.transform.candidate_generation.LastFMClient",
+        MagicMock(return_value=client),
+    )
+    return client
+
+
+@pytest.fixture(scope="session")
+def _silver_base_bundle(tmp_path_factory) -> Path:
+    """Write the base silver/gold Delta tables once per session."""
+    bundle_dir = tmp_path_factory.mktemp("silver_base")
+    _write_silver_base_tables(_delta_io_factory(bundle_dir))
+    return bundle_dir
+
+
+@pytest.fixture
+def silver_base_tables(test_data_dir, _silver_base_bundle):
+    """Copy the session's base tables into this test's data directory."""
+    shutil.copytree(_silver_base_bundle, test_data_dir, dirs_exist_ok=True)
+
 
-    gold_mgr = PolarsDeltaIOManager(medallion_layer="gold")
-    gold_mgr.base_uri = str(test_data_dir / "gold")
+@pytest.fixture(scope="session")
+def _merge_tables_bundle(tmp_path_factory) -> Path:
+    """Write the merge_candidate_sources input tables once per session."""
+    bundle_dir = tmp_path_factory.mktemp("merge_tables")
+    _seed_merge_tables(_delta_io_factory(bundle_dir)("silver"))
+    return bundle_dir
 
-    def factory(layer: str = "silver"):
-        if layer == "gold":
-            return gold_mgr
-        return silver_mgr
 
+@pytest.fixture
+def merge_tables(_merge_tables_bundle, monkeypatch):
+    """Point PolarsDeltaIOManager at the shared, read-only merge input tables."""
+    factory = _delta_io_factory(_merge_tables_bundle)
+    monkeypatch.setattr(
+        "music_airflow.transform.candidate_generation.PolarsDeltaIOManager", factory
+    )
     return factory
 
 
+def _seed_merge_tables(silver_io: PolarsDeltaIOManager) -> None:
+    """Create the silver tables read by merge_candidate_sources."""
+    for table_name, df in (
+        ("plays", _MERGE_PLAYS_DF),
+        ("tracks", _MERGE_TRACKS_DF),
+        ("artists", _MERGE_ARTISTS_DF),
+        ("candidate_similar_artist", _SIMILAR_ARTIST_DF),
+        ("candidate_similar_tag", _SIMILAR_TAG_DF),
+        ("candidate_deep_cut", _DEEP_CUT_DF),
+    ):
+        silver_io.write_delta(df, table_name=table_name, mode="overwrite")
+
+
 def _write_silver_base_tables(patched_delta_io):
     """Create minimal silver tables for plays, tracks, artists."""
-    # Plays: one user with a played track (track_id format: "track|artist" normalized)
-    plays_df = pl.DataFrame(
-        {
-            "username": ["user1"],
-            "track_id": ["known|artist a"],  # normalized
-        }
-    )
     patched_delta_io("silver").write_delta(
-        plays_df, table_name="plays", mode="overwrite"
+        _PLAYS_DF, table_name="plays", mode="overwrite"
     )
 
-    # Tracks: map track_id -> artist_id and include tags
-    tracks_df = pl.DataFrame(
-        {
-            "track_id": [
-                "known|artist a",  # normalized
-                "new track|artist b",
-                "tag track|artist c",
-            ],
-            "artist_id": ["a1", "b1", "c1"],
-        }
-    )
     patched_delta_io("silver").write_delta(
-        tracks_df, table_name="tracks", mode="overwrite"
+        _TRACKS_DF, table_name="tracks", mode="overwrite"
     )
 
-    # Artists: map artist_id -> artist_name and tags
-    # Include artist_mbid for deep cut filtering
-    artists_df = pl.DataFrame(
-        {
-            "artist_id": ["a1", "b1", "c1"],
-            "artist_name": ["Artist A", "Artist B", "Artist C"],
-            "artist_mbid": ["a_mbid", "b_mbid", "c_mbid"],
-            "tags": ["rock,indie,alt", "indie", "rock"],
-        }
-    )
     patched_delta_io("silver").write_delta(
-        artists_df, table_name="artists", mode="overwrite"
+        _ARTISTS_DF, table_name="artists", mode="overwrite"
     )
 
-    # Gold artist_play_count: user's play stats for each artist
-    artist_play_counts_df = pl.DataFrame(
-        {
-            "username": ["user1", "user1", "user1"],
-            "artist_id": ["a1", "b1", "c1"],
-            "artist_name": ["Artist A", "Artist B", "Artist C"],
-            "play_count": [10, 5, 3],
-        }
-    )
     patched_delta_io("gold").write_delta(
-        artist_play_counts_df, table_name="artist_play_count", mode="overwrite"
+        _ARTIST_PC_DF, table_name="artist_play_count", mode="overwrite"
     )
 
 
+def _read_table(path: Path, *columns: str) -> pl.DataFrame:
+    """Read the given columns of a Delta table, decoding only those columns."""
+    return pl.scan_delta(str(path)).select(columns).collect()
+
+
 class TestSimilarArtistCandidates:
     @pytest.mark.asyncio
     async def test_cleanup_removes_played_candidates(
-        self, test_data_dir, patched_delta_io
+        self, test_data_dir, patched_delta_io, mock_lastfm_client, silver_base_tables
     ):
         """Test that candidates are removed from silver table after being played."""
-        _write_silver_base_tables(patched_delta_io)
-
         # Pre-populate candidate table with a track that will be "played"
         existing_candidates = pl.DataFrame(
             {
@@ -132,181 +383,70 @@ class TestSimilarArtistCandidates:
             plays_df, table_name="plays", mode="overwrite"
         )
 
-        with (
-            patch(
-                "music_airflow.transform.candidate_generation.LastFMClient"
-            ) as MockClient,
-            patch(
-                "music_airflow.transform.candidate_generation.PolarsDeltaIOManager"
-            ) as MockDeltaIO,
-        ):
-            from unittest.mock import AsyncMock
-
-            client = MockClient.return_value
-            client.__aenter__ = AsyncMock(return_value=client)
-            client.__aexit__ = AsyncMock(return_value=None)
-            # Return empty results - no new candidates
-            client.get_similar_artists = AsyncMock(return_value=[])
-            client.get_artist_top_tracks = AsyncMock(return_value=[])
-
-            MockDeltaIO.side_effect = lambda medallion_layer="silver": patched_delta_io(
-                medallion_layer
-            )
-
-            await generate_similar_artist_candidates(
-                username="user1",
-                artist_sample_rate=1.0,
-            )
+        client = mock_lastfm_client
+        # Return empty results - no new candidates
+        client.get_similar_artists = AsyncMock(return_value=[])
+        client.get_artist_top_tracks = AsyncMock(return_value=[])
+
+        await generate_similar_artist_candidates(
+            username="user1",
+            artist_sample_rate=1.0,
+        )
 
         # Check that played track was removed from candidates
-        df = pl.read_delta(str(test_data_dir / "silver" / "candidate_similar_artist"))
-        remaining_tracks = df["track_id"].to_list()
+        df = (
+            pl.scan_delta(str(test_data_dir / "silver" / "candidate_similar_artist"))
+            .select("track_id")
+            .collect()
+        )
+        remaining_tracks = set(df["track_id"])
         assert "played track|artist x" not in remaining_tracks
         assert "unplayed track|artist y" in remaining_tracks
 
     @pytest.mark.asyncio
     async def test_generates_and_filters_original(
-        self, test_data_dir, patched_delta_io
+        self, test_data_dir, patched_delta_io, mock_lastfm_client, silver_base_tables
     ):
         """Test that candidate generation correctly filters existing plays and low-listener tracks."""
-        _write_silver_base_tables(patched_delta_io)
-
-        with (
-            patch(
-                "music_airflow.transform.candidate_generation.LastFMClient"
-            ) as MockClient,
-            patch(
-                "music_airflow.transform.candidate_generation.PolarsDeltaIOManager"
-            ) as MockDeltaIO,
-        ):
-            from unittest.mock import AsyncMock
-
-            client = MockClient.return_value
-            client.__aenter__ = AsyncMock(return_value=client)
-            client.__aexit__ = AsyncMock(return_value=None)
-            # Similar artists for Artist A: include a clone (match>0.9) which should be filtered
-            client.get_similar_artists = AsyncMock(
-                return_value=[
-                    {"name": "Artist B", "match": 0.5},
-                    {"name": "Artist A", "match": 0.95},  # filtered out
-                ]
-            )
-            # Top tracks for Artist B: include one below min_listeners to be filtered
-            client.get_artist_top_tracks = AsyncMock(
-                return_value=[
-                    {
-                        "name": "New Track",
-                        "mbid": "tmbid",
-                        "artist": {"name": "Artist B", "mbid": "bmbid"},
-                        "listeners": 5000,
-                        "playcount": 10000,
-                    },
-                    {
-                        "name": "Too Small",
-                        "mbid": "",
-                        "artist": {"name": "Artist B", "mbid": "bmbid"},
-                        "listeners": 10,
-                        "playcount": 20,
-                    },
-                ]
-            )
-
-            # Patch IO manager construction to use our preconfigured instances
-            MockDeltaIO.side_effect = lambda medallion_layer="silver": patched_delta_io(
-                medallion_layer
-            )
-
-            result = await generate_similar_artist_candidates(
-                username="user1",
-                artist_sample_rate=1.0,
-            )
+        client = mock_lastfm_client
+        client.get_similar_artists = AsyncMock(return_value=_SIMILAR_ARTISTS_A)
+        client.get_artist_top_tracks = AsyncMock(return_value=_TOP_TRACKS_B)
+
+        result = await generate_similar_artist_candidates(
+            username="user1",
+            artist_sample_rate=1.0,
+        )
 
         # Validate metadata and Delta output
         assert result["table_name"] == "candidate_similar_artist"
         out_path = Path(result["path"])  # data/silver/candidate_similar_artist
         assert out_path.exists()
-        df = pl.read_delta(str(out_path))
-        # Only New Track should remain (clone and small filtered); uses canonical ID
-        assert df["track_id"].to_list() == ["new track|artist b"]
-        assert df["username"].to_list() == ["user1"]
+        df = _read_table(out_path, *_EXPECTED_SIMILAR_ARTIST.columns)
+        assert_frame_equal(df, _EXPECTED_SIMILAR_ARTIST)
 
 
 class TestSimilarTagCandidates:
     @pytest.mark.asyncio
     async def test_tag_profile_matching_with_min_matches(
-        self, test_data_dir, patched_delta_io
+        self, test_data_dir, patched_delta_io, mock_lastfm_client, silver_base_tables
     ):
-        _write_silver_base_tables(patched_delta_io)
-
-        with (
-            patch(
-                "music_airflow.transform.candidate_generation.LastFMClient"
-            ) as MockClient,
-            patch(
-                "music_airflow.transform.candidate_generation.PolarsDeltaIOManager"
-            ) as MockDeltaIO,
-        ):
-            from unittest.mock import AsyncMock
-
-            client = MockClient.return_value
-            client.__aenter__ = AsyncMock(return_value=client)
-            client.__aexit__ = AsyncMock(return_value=None)
-
-            # Return top tracks for each tag (rock, indie, alt)
-            # Track A appears in multiple tags (meets min_tag_matches=3)
-            # Track B appears in only 1 tag (filtered out)
-            async def mock_get_tag_top_tracks(tag, limit=30):
-                if tag == "rock":
-                    return [
-                        {
-                            "name": "Rock Track A",
-                            "mbid": "rta_mbid",
-                            "artist": {"name": "Artist D", "mbid": "d_mbid"},
-                            "@attr": {"rank": "1"},
-                        },
-                        {
-                            "name": "Rock Track B",
-                            "mbid": "rtb_mbid",
-                            "artist": {"name": "Artist E", "mbid": "e_mbid"},
-                            "@attr": {"rank": "2"},
-                        },
-                    ]
-                elif tag == "indie":
-                    return [
-                        {
-                            "name": "Rock Track A",  # Same track, different tag
-                            "mbid": "rta_mbid",
-                            "artist": {"name": "Artist D", "mbid": "d_mbid"},
-                            "@attr": {"rank": "3"},
-                        },
-                    ]
-                elif tag == "alt":
-                    return [
-                        {
-                            "name": "Rock Track A",  # Same track, third tag
-                            "mbid": "rta_mbid",
-                            "artist": {"name": "Artist D", "mbid": "d_mbid"},
-                            "@attr": {"rank": "5"},
-                        },
-                    ]
-                return []
-
-            client.get_tag_top_tracks = mock_get_tag_top_tracks
-
-            MockDeltaIO.side_effect = lambda medallion_layer="silver": patched_delta_io(
-                medallion_layer
-            )
-
-            result = await generate_similar_tag_candidates(
-                username="user1",
-                top_tags_count=3,
-                min_tag_matches=3,  # explicitly test with 3 matches
-            )
+        client = mock_lastfm_client
+        client.get_tag_top_tracks = AsyncMock(
+            side_effect=lambda tag, limit=30: _TAG_TOP_TRACKS.get(tag, [])
+        )
+
+        result = await generate_similar_tag_candidates(
+            username="user1",
+            top_tags_count=3,
+            min_tag_matches=3,  # explicitly test with 3 matches
+        )
 
         assert result["table_name"] == "candidate_similar_tag"
         out_path = Path(result["path"])
         assert out_path.exists()
-        df = pl.read_delta(str(out_path))
+        df = _read_table(
+            out_path, "track_id", "tag_match_count", "source_tags", "score"
+        )
 
         # Only Rock Track A should be in results (appears in 3 tags)
         # Rock Track B only appears in 1 tag, filtered out
@@ -321,185 +461,28 @@ class TestSimilarTagCandidates:
 
 class TestDeepCutCandidates:
     @pytest.mark.asyncio
-    async def test_generation_and_filters(self, test_data_dir, patched_delta_io):
-        _write_silver_base_tables(patched_delta_io)
-
-        with (
-            patch(
-                "music_airflow.transform.candidate_generation.LastFMClient"
-            ) as MockClient,
-            patch(
-                "music_airflow.transform.candidate_generation.PolarsDeltaIOManager"
-            ) as MockDeltaIO,
-        ):
-            from unittest.mock import AsyncMock
-
-            client = MockClient.return_value
-            client.__aenter__ = AsyncMock(return_value=client)
-            client.__aexit__ = AsyncMock(return_value=None)
-
-            # Mock get_artist_top_albums to return albums only for Artist A
-            async def mock_top_albums(artist_name, limit=10):
-                if artist_name == "Artist A":
-                    return [
-                        {
-                            "name": "Album One",
-                            "playcount": 10000,
-                            "artist": {"mbid": "a_mbid"},
-                        },
-                        {
-                            "name": "Album Two",
-                            "playcount": 1000000,
-                            "artist": {"mbid": "a_mbid"},
-                        },
-                    ]
-                else:
-                    # Other artists have no albums above threshold
-                    return []
-
-            client.get_artist_top_albums = mock_top_albums
-
-            # Album info returns track list including one already played
-            async def mock_album_info(album_name, artist_name):
-                if album_name == "Album One":
-                    return {
-                        "tracks": {
-                            "track": [
-                                {"name": "Hidden Gem", "mbid": "hg_mbid"},
-                                {"name": "Known", "mbid": ""},
-                            ]
-                        }
-                    }
-                else:  # Album Two
-                    return {
-                        "tracks": {
-                            "track": [
-                                {"name": "Popular Track", "mbid": "pt_mbid"},
-                            ]
-                        }
-                    }
-
-            client.get_album_info = mock_album_info
-
-            MockDeltaIO.side_effect = lambda medallion_layer="silver": patched_delta_io(
-                medallion_layer
-            )
-            result = await generate_deep_cut_candidates(username="user1")
+    async def test_generation_and_filters(
+        self, test_data_dir, patched_delta_io, mock_lastfm_client, silver_base_tables
+    ):
+        client = mock_lastfm_client
+        client.get_artist_top_albums = AsyncMock(
+            side_effect=lambda artist_name, limit=10: _TOP_ALBUMS.get(artist_name, [])
+        )
+        client.get_album_info = AsyncMock(
+            side_effect=lambda album_name, artist_name: _ALBUM_INFO[album_name]
+        )
+
+        result = await generate_deep_cut_candidates(username="user1")
 
         assert result["table_name"] == "candidate_deep_cut"
         out_path = Path(result["path"])  # data/silver/candidate_deep_cut
         assert out_path.exists()
-        df = pl.read_delta(str(out_path)).sort("track_id")
-        # Both Hidden Gem and Popular Track should be included (no max_listeners filter)
-        # Known|Artist A is filtered because already played
-        assert df["track_id"].to_list() == [
-            "hidden gem|artist a",
-            "popular track|artist a",
-        ]
+        df = _read_table(out_path, *_EXPECTED_DEEP_CUT.columns).sort("track_id")
+        assert_frame_equal(df, _EXPECTED_DEEP_CUT)
 
 
 class TestMergeCandidateSources:
-    def test_dedup_and_source_flags(self, test_data_dir, patched_delta_io):
-        # Write plays table (empty for this user to not filter candidates)
-        plays_df = pl.DataFrame(
-            {
-                "username": ["user1"],
-                "track_id": ["some_other_track"],
-            }
-        )
-        patched_delta_io("silver").write_delta(
-            plays_df, table_name="plays", mode="overwrite"
-        )
-
-        # Write dimension tables needed for joins
-        tracks_df = pl.DataFrame(
-            {
-                "track_id": ["artist b::new track", "artist c::tag track"],
-                "track_name": ["New Track", "Tag Track"],
-                "track_mbid": ["tmbid", "tm2"],
-                "artist_name": ["Artist B", "Artist C"],
-                "artist_id": ["b1", "c1"],
-                "duration_ms": [180000, 240000],
-                "tags": ["rock,indie", "rock,pop"],
-                "listeners": [5000, 6000],
-                "playcount": [10000, 6000],
-                "youtube_url": [
-                    "https://youtube.com/watch?v=1",
-                    "https://youtube.com/watch?v=2",
-                ],
-                "spotify_url": [
-                    "https://open.spotify.com/track/1",
-                    "https://open.spotify.com/track/2",
-                ],
-            }
-        )
-        patched_delta_io("silver").write_delta(
-            tracks_df, table_name="tracks", mode="overwrite"
-        )
-
-        artists_df = pl.DataFrame(
-            {
-                "artist_id": ["a1", "b1", "c1"],
-                "artist_name": ["Artist A", "Artist B", "Artist C"],
-                "artist_mbid": ["ambid", "bmbid", "cmbid"],
-            }
-        )
-        patched_delta_io("silver").write_delta(
-            artists_df, table_name="artists", mode="overwrite"
-        )
-
-        # Write synthetic silver candidate tables with updated schema (includes artist_mbid)
-        similar_artist_df = pl.DataFrame(
-            {
-                "username": ["user1"],
-                "track_id": ["artist b::new track"],
-                "track_name": ["New Track"],
-                "artist_name": ["Artist B"],
-                "track_mbid": ["tmbid"],
-                "artist_mbid": ["bmbid"],
-                "score": [10000],
-                "similarity": [0.85],
-                "source_artist_id": ["a1"],
-            }
-        )
-        patched_delta_io("silver").write_delta(
-            similar_artist_df, table_name="candidate_similar_artist", mode="overwrite"
-        )
-
-        similar_tag_df = pl.DataFrame(
-            {
-                "username": ["user1", "user1"],
-                "track_id": ["artist b::new track", "artist c::tag track"],
-                "track_name": ["New Track", "Tag Track"],
-                "artist_name": ["Artist B", "Artist C"],
-                "track_mbid": ["tmbid", "tm2"],
-                "artist_mbid": ["bmbid", "cmbid"],
-                "tag_match_count": [3, 4],
-                "avg_rank": [5.0, 3.0],
-                "score": [3095.0, 4097.0],
-                "source_tags": ["rock,indie,alt", "rock,indie,alt,pop"],
-            }
-        )
-        patched_delta_io("silver").write_delta(
-            similar_tag_df, table_name="candidate_similar_tag", mode="overwrite"
-        )
-
-        deep_cut_df = pl.DataFrame(
-            {
-                "username": ["user1"],
-                "track_id": ["artist c::tag track"],
-                "track_name": ["Tag Track"],
-                "artist_name": ["Artist C"],
-                "track_mbid": ["tm2"],
-                "artist_mbid": ["cmbid"],
-                "score": [6000.0],
-                "source_artist_id": ["c1"],
-            }
-        )
-        patched_delta_io("silver").write_delta(
-            deep_cut_df, table_name="candidate_deep_cut", mode="overwrite"
-        )
-
+    def test_dedup_and_source_flags(self, merge_tables, monkeypatch):
         # Track Firestore writes
         firestore_writes = {}
 
@@ -508,19 +491,11 @@ class TestMergeCandidateSources:
                 firestore_writes[username] = df
                 return {"rows": len(df), "username": username}
 
-        with (
-            patch(
-                "music_airflow.transform.candidate_generation.PolarsDeltaIOManager"
-            ) as MockDeltaIO,
-            patch(
-                "music_airflow.transform.candidate_generation.FirestoreIOManager",
-                MockFirestoreIOManager,
-            ),
-        ):
-            MockDeltaIO.side_effect = lambda medallion_layer="silver": patched_delta_io(
-                medallion_layer
-            )
-            result = merge_candidate_sources(username="user1")
+        monkeypatch.setattr(
+            "music_airflow.transform.candidate_generation.FirestoreIOManager",
+            MockFirestoreIOManager,
+        )
+        result = merge_candidate_sources(username="user1")
         assert result["table_name"] == "track_candidates"
         assert result["path"] == "firestore://users/user1/track_candidates"
         assert "user1" in firestore_writes
@@ -528,9 +503,9 @@ class TestMergeCandidateSources:
 
         # Expect two deduped rows with correct flags
         assert merged.shape[0] == 2
-        rows = {row["track_id"]: row for row in merged.iter_rows(named=True)}
+        idx = {tid: i for i, tid in enumerate(merged["track_id"].to_list())}
 
-        b_row = rows["artist b::new track"]
+        b_row = merged.row(idx["artist b::new track"], named=True)
         assert b_row["similar_artist"] is True
         assert b_row["similar_tag"] is True
         assert b_row["deep_cut_same_artist"] is False
@@ -549,7 +524,7 @@ class TestMergeCandidateSources:
         assert b_row["why_similar_tags"] == "rock,indie,alt"
         assert b_row["why_tag_match_count"] == 3
 
-        c_row = rows["artist c::tag track"]
+        c_row = merged.row(idx["artist c::tag track"], named=True)
         assert c_row["similar_artist"] is False
         assert c_row["similar_tag"] is True
         assert c_row["deep_cut_same_artist"] is True
@@ -122,14 +122,16 @@ def test_compute_artist_aggregations(
     ).collect()
 
     # Check schema - should have artist_id instead of artist_mbid
-    assert "username" in result_df.columns
-    assert "artist_id" in result_df.columns
-    assert "artist_name" in result_df.columns
-    assert "play_count" in result_df.columns
-    assert "first_played_on" in result_df.columns
-    assert "last_played_on" in result_df.columns
-    assert "recency_score" in result_df.columns
-    assert "days_since_last_play" in result_df.columns
+    assert {
+        "username",
+        "artist_id",
+        "artist_name",
+        "play_count",
+        "first_played_on",
+        "last_played_on",
+        "recency_score",
+        "days_since_last_play",
+    } <= set(result_df.columns)
     assert "user_half_life_days" not in result_df.columns
 
     # Check user1 - Artist X (3 plays)
@@ -171,12 +173,14 @@ def test_compute_track_aggregations(sample_plays_df, sample_dim_users_df):
     ).collect()
 
     # Check schema
-    assert "username" in result_df.columns
-    assert "track_id" in result_df.columns
-    assert "track_name" in result_df.columns
-    assert "artist_name" in result_df.columns
-    assert "play_count" in result_df.columns
-    assert "recency_score" in result_df.columns
+    assert {
+        "username",
+        "track_id",
+        "track_name",
+        "artist_name",
+        "play_count",
+        "recency_score",
+    } <= set(result_df.columns)
     assert "user_half_life_days" not in result_df.columns
 
     # Check user1 - Song A (3 plays)
@@ -394,10 +398,12 @@ class TestComputeArtistPlayCountsIntegration:
         # Verify Firestore received the data
         assert "user1" in firestore_writes
         gold_df = firestore_writes["user1"]
-        assert "play_count" in gold_df.columns
-        assert "recency_score" in gold_df.columns
-        assert "days_since_last_play" in gold_df.columns
-        assert "artist_id" in gold_df.columns
+        assert {
+            "play_count",
+            "recency_score",
+            "days_since_last_play",
+            "artist_id",
+        } <= set(gold_df.columns)
         # Verify artist_id and artist_name are present
         artist_x_row = gold_df.filter(pl.col("artist_id") == "Artist X")
         assert len(artist_x_row) == 1
@@ -334,6 +334,19 @@ class TestPolarsDeltaIOManager:
         final_df = pl.read_delta(str(test_data_dir / "silver" / "test_table"))
         assert len(final_df) == 4
 
+    def test_write_delta_creates_local_dir_once(self, test_data_dir):
+        """Test that the local table directory is only created on first write."""
+        manager = PolarsDeltaIOManager(medallion_layer="silver")
+        manager.base_uri = str(test_data_dir / "silver")
+
+        df = pl.DataFrame({"id": [1, 2], "value": ["a", "b"]})
+        with patch.object(Path, "mkdir", autospec=True, side_effect=Path.mkdir) as m:
+            manager.write_delta(df, "test_table", mode="overwrite")
+            manager.write_delta(df, "test_table", mode="append")
+
+        assert m.call_count == 1
+        assert manager._get_table_uri("test_table") in manager._mkdir_cache
+
     def test_table_exists(self, test_data_dir):
         """Test table_exists method."""
         manager = PolarsDeltaIOManager(medallion_layer="silver")
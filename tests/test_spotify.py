@@ -130,6 +130,87 @@ class TestSpotifySearch:
             mock_creds.return_value = (None, None)
             assert is_spotify_configured() is False
 
+    def test_search_spotify_track_id_prefers_matching_artist(
+        self, mock_spotify_credentials
+    ):
+        """Test that a single search call picks the result by the requested artist."""
+        import music_airflow.utils.spotify_search as spotify_module
+        from music_airflow.utils.spotify_search import search_spotify_track_id
+
+        spotify_module._spotify = None
+
+        mock_client = MagicMock()
+        mock_client.search.return_value = {
+            "tracks": {
+                "items": [
+                    {"id": "cover", "name": "Song", "artists": [{"name": "Other"}]},
+                    {"id": "orig", "name": "Song", "artists": [{"name": "The Band"}]},
+                ]
+            }
+        }
+
+        with patch(
+            "music_airflow.utils.spotify_search.SpotifyClientCredentials"
+        ) as mock_auth:
+            mock_auth.return_value = MagicMock()
+            with patch(
+                "music_airflow.utils.spotify_search.Spotify"
+            ) as mock_spotify_class:
+                mock_spotify_class.return_value = mock_client
+
+                result = search_spotify_track_id("Song", "the band")
+
+        assert result == "orig"
+        assert mock_client.search.call_count == 1
+
+    def test_search_does_not_retry_on_not_found(self):
+        """Test that non-429 client errors fail fast without retrying."""
+        from spotipy.exceptions import SpotifyException
+
+        from music_airflow.utils.spotify_search import _search_with_retry
+
+        mock_client = MagicMock()
+        mock_client.search.side_effect = SpotifyException(404, -1, "Not found")
+
+        with pytest.raises(SpotifyException):
+            _search_with_retry(mock_client, "query", type="track")
+
+        assert mock_client.search.call_count == 1
+
+    def test_search_retries_on_rate_limit_using_retry_after(self):
+        """Test that 429s are retried, waiting for the Retry-After header."""
+        from spotipy.exceptions import SpotifyException
+
+        from music_airflow.utils.spotify_search import _search_with_retry
+
+        mock_client = MagicMock()
+        mock_client.search.side_effect = [
+            SpotifyException(429, -1, "Rate limited", headers={"Retry-After": "0"}),
+            {"tracks": {"items": []}},
+        ]
+
+        result = _search_with_retry(mock_client, "query", type="track")
+
+        assert result == {"tracks": {"items": []}}
+        assert mock_client.search.call_count == 2
+
+    @pytest.mark.parametrize(
+        ("retry_after", "expected"),
+        [("5", 5.0), ("86400", 60.0), ("-1", 2.0), ("inf", 2.0), ("soon", 2.0)],
+    )
+    def test_retry_after_wait_is_clamped(self, retry_after, expected):
+        """Test that Retry-After is capped and bad values fall back to backoff."""
+        from spotipy.exceptions import SpotifyException
+
+        from music_airflow.utils.spotify_search import _wait_retry_after
+
+        retry_state = MagicMock(attempt_number=1)
+        retry_state.outcome.exception.return_value = SpotifyException(
+            429, -1, "Rate limited", headers={"Retry-After": retry_after}
+        )
+
+        assert _wait_retry_after(retry_state) == expected
+
 
 class TestSpotifyPlaylistGenerator:
     """Tests for Spotify playlist generator."""
@@ -5,11 +5,17 @@ Unit tests for text normalization utilities.
 import polars as pl
 
 from music_airflow.utils.text_normalization import (
+    TAG_FEAT,
+    TAG_LIVE,
+    TAG_MUSIC_VIDEO,
+    TAG_REMASTER,
     normalize_text,
+    normalize_text_tagged,
     is_music_video,
     generate_canonical_track_id,
     generate_canonical_artist_id,
     normalize_text_expr,
+    normalize_text_batch,
     generate_canonical_track_id_expr,
     generate_canonical_artist_id_expr,
     is_music_video_expr,
@@ -49,6 +55,9 @@ class TestNormalizeText:
         assert normalize_text("Song (Acoustic Version)") == "song"
         assert normalize_text("Song (Single Version)") == "song"
         assert normalize_text("Song (Remix)") == "song"
+        assert normalize_text("Song (Extended)") == "song"
+        # Version matches may span parentheticals; stored track IDs rely on it
+        assert normalize_text("Song (Part 1) (Single Version)") == "song"
 
     def test_explicit_removal(self):
         """Test removal of explicit/clean indicators."""
@@ -85,6 +94,8 @@ class TestNormalizeText:
         assert normalize_text("Song's Name") == "songs name"
         assert normalize_text("Hip-Hop") == "hip-hop"
         assert normalize_text("Song, Name") == "song name"
+        # Non-ASCII punctuation is removed too
+        assert normalize_text("Café – Song’s Name") == "café songs name"
 
     def test_complex_normalization(self):
         """Test complex cases with multiple patterns."""
@@ -99,6 +110,12 @@ class TestNormalizeText:
         )
         assert normalize_text("Track!!! (Explicit) [Remastered]") == "track"
 
+    def test_nested_parentheticals(self):
+        """Test nested parentheticals are removed inner-first."""
+        assert normalize_text("Song (Live at Wembley (Remastered 2011))") == "song"
+        assert normalize_text("Song (Demo (Mono))") == "song"
+        assert normalize_text("Song official video (Live (Remastered))") == "song"
+
     def test_dash_separated_suffixes(self):
         """Test removal of dash-separated suffixes like '- Demo', '- Early Take'."""
         # Demo patterns
@@ -188,6 +205,48 @@ class TestNormalizeText:
         assert normalize_text("Café") == "café"
         assert normalize_text("Naïve") == "naïve"
 
+    def test_long_whitespace_runs_are_linear(self):
+        """Test that long whitespace runs do not trigger quadratic matching."""
+        import timeit
+
+        def best_time(spaces: int) -> float:
+            def run():
+                assert normalize_text("a" + " " * spaces + "-") == "a -"
+                assert normalize_text("Song" + " " * spaces + "(x) 1999") == "song x"
+
+            return min(timeit.repeat(run, number=1, repeat=5))
+
+        # 8x the input is about 8x the time when linear and 64x when quadratic
+        assert best_time(16000) < 24 * best_time(2000)
+
+
+class TestNormalizeTextTagged:
+    """Tests for normalize_text_tagged function."""
+
+    def test_matches_normalize_text(self):
+        """Test that the normalized text is the same as normalize_text."""
+        for text in ["Song (Live (Remastered))", "Track - Radio Edit", "Plain"]:
+            assert normalize_text_tagged(text)[0] == normalize_text(text)
+
+    def test_tags_removed_variations(self):
+        """Test that each removed variation sets its tag bit."""
+        assert normalize_text_tagged("Song (Live) (feat. X)") == (
+            "song",
+            TAG_LIVE | TAG_FEAT,
+        )
+        assert normalize_text_tagged("Song (Live (Remastered))")[1] == (
+            TAG_LIVE | TAG_REMASTER
+        )
+        assert normalize_text_tagged("Song feat. X")[1] == TAG_FEAT
+        assert normalize_text_tagged("Song Name") == ("song name", 0)
+        assert normalize_text_tagged("") == ("", 0)
+
+    def test_music_video_tag(self):
+        """Test that the music video tag agrees with is_music_video."""
+        assert normalize_text_tagged("Song (Official Video)")[1] & TAG_MUSIC_VIDEO
+        assert normalize_text_tagged("Song (Video Clip)")[1] & TAG_MUSIC_VIDEO
+        assert not normalize_text_tagged("Song (Live)")[1] & TAG_MUSIC_VIDEO
+
 
 class TestIsMusicVideo:
     """Tests for is_music_video function."""
@@ -466,6 +525,7 @@ class TestPolarsExpressions:
             "Track (Official Video)",
             "  Spaced  Text  ",
             "UPPERCASE TRACK",
+            "Song (Extended)",
         ]
 
         df = pl.DataFrame({"text": test_cases})
@@ -478,6 +538,22 @@ class TestPolarsExpressions:
         expected = [normalize_text(t) for t in test_cases]
         assert result == expected
 
+    def test_normalize_text_batch_matches_expr(self):
+        """Verify normalize_text_batch matches normalize_text_expr element-wise."""
+        test_cases = [
+            "Song (Live (Remastered))",
+            "Track - Radio Edit",
+            "",
+            "Plain",
+            "İstanbul",
+        ]
+
+        df = pl.DataFrame({"text": test_cases})
+        expected = df.select(normalize_text_expr("text")).to_series().to_list()
+        assert normalize_text_batch(test_cases) == expected
+        assert normalize_text_batch([None]) == [""]
+        assert normalize_text_batch([]) == []
+
     def test_generate_canonical_track_id_expr_matches_python(self):
         """Verify generate_canonical_track_id_expr produces same output as Python function."""
         test_cases = [
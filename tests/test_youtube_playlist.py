@@ -688,3 +688,45 @@ class TestCredentialLoading:
         creds = load_youtube_creds()
 
         assert creds is not None
+
+
+class TestYTMusicClient:
+    """Tests for the shared YTMusic search client."""
+
+    @patch("music_airflow.utils.ytmusic_search.YTMusic")
+    def test_client_reused_within_thread_not_across(self, mock_ytmusic_class):
+        """Test each thread initializes one client and reuses it."""
+        import threading
+
+        from music_airflow.utils import ytmusic_search
+
+        mock_ytmusic_class.side_effect = lambda: MagicMock()
+        ytmusic_search._local.__dict__.clear()
+
+        first = ytmusic_search._get_ytmusic()
+        assert ytmusic_search._get_ytmusic() is first
+
+        other = []
+        thread = threading.Thread(
+            target=lambda: other.append(ytmusic_search._get_ytmusic())
+        )
+        thread.start()
+        thread.join()
+
+        assert other[0] is not first
+        assert mock_ytmusic_class.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_search_youtube_urls_preserves_order(self):
+        """Test batch search returns one URL per pair, in input order."""
+        from music_airflow.utils import ytmusic_search
+
+        def fake_search(track_name, artist_name):
+            return None if track_name == "missing" else f"url:{track_name}"
+
+        with patch.object(ytmusic_search, "search_youtube_url", fake_search):
+            urls = await ytmusic_search.search_youtube_urls(
+                [("a", "x"), ("missing", "y"), ("c", "z")], max_concurrency=2
+            )
+
+        assert urls == ["url:a", None, "url:c"]